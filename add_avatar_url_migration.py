@@ -13,18 +13,23 @@ def add_avatar_url_column():
     
     try:
         conn = sqlite3.connect(db_path)
+        # WAL + synchronous=NORMAL: без fsync журнала отката на каждый commit
+        # (рядом с БД появятся служебные файлы user_news.db-wal и user_news.db-shm)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
         cursor = conn.cursor()
         
-        # Проверяем, существует ли колонка
-        cursor.execute("PRAGMA table_info(user_news)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'avatar_url' not in columns:
-            print("Добавляем колонку avatar_url...")
+        # ALTER TABLE идемпотентен через обработку ошибки дубликата колонки
+        try:
             cursor.execute("ALTER TABLE user_news ADD COLUMN avatar_url TEXT")
             conn.commit()
             print("✅ Колонка avatar_url добавлена")
-        else:
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
             print("✅ Колонка avatar_url уже существует")
         
         conn.close()
@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
 """
-Запуск Telegram бота с полной изоляцией процесса
+Запуск Telegram бота
 """
 
-import multiprocessing
 import os
 import sys
 
 def run_bot_process():
-    """Функция для запуска бота в отдельном процессе"""
+    """Запуск бота в текущем процессе"""
     # Настройка окружения
     os.chdir(os.path.dirname(__file__))
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
@@ -29,41 +28,19 @@ def run_bot_process():
 
 def main():
     """Главная функция"""
-    print("🚀 Запуск Telegram бота в изолированном процессе...")
-
-    # Устанавливаем метод запуска для Windows
-    if hasattr(multiprocessing, 'set_start_method'):
-        try:
-            multiprocessing.set_start_method('spawn', force=True)
-        except RuntimeError:
-            pass  # Метод уже установлен
-
-    # Создаем и запускаем процесс
-    bot_process = multiprocessing.Process(target=run_bot_process, name='TelegramBot')
-    bot_process.daemon = False
+    # Отдельный процесс (spawn) ничего не изолировал: родитель только ждал join(),
+    # а стоил второго запуска интерпретатора и повторного импорта всех модулей
+    print("🚀 Запуск Telegram бота...")
+    print(f"✅ Бот запущен в процессе PID: {os.getpid()}")
+    print("Для остановки нажмите Ctrl+C")
 
     try:
-        bot_process.start()
-        print(f"✅ Бот запущен в процессе PID: {bot_process.pid}")
-        print("Для остановки нажмите Ctrl+C")
-
-        # Ждем завершения процесса
-        bot_process.join()
-
+        run_bot_process()
     except KeyboardInterrupt:
         print("\n🛑 Остановка бота...")
-        if bot_process.is_alive():
-            bot_process.terminate()
-            bot_process.join(timeout=5)
-            if bot_process.is_alive():
-                bot_process.kill()
         print("✅ Бот остановлен")
     except Exception as e:
         print(f"❌ Ошибка запуска: {e}")
-        if bot_process.is_alive():
-            bot_process.terminate()
 
 if __name__ == "__main__":
-    # Необходимая защита для Windows
-    multiprocessing.freeze_support()
     main()
@@ -4,17 +4,31 @@
 Мониторит канал и сохраняет новые сообщения в базу данных для дальнейшей обработки.
 """
 
+import atexit
 import os
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import random
+import queue
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
 import re
+from collections import OrderedDict, deque
 from datetime import datetime
-from urllib.parse import urlparse
-import atexit
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+import signal
+
+# Быстрый разбор JSON ответов Telegram (опционально)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Загружаем переменные окружения
 env_path = Path('.') / 'config' / '.env'
@@ -33,21 +47,137 @@ except ImportError as e:
     sys.exit(1)
 
 
-# Настройка логирования
+# Настройка логирования: запись в файл и консоль идет в отдельном потоке,
+# обработка сообщений только кладет записи в очередь
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('logs/debug_monitor.log', encoding='utf-8'),
+    logging.StreamHandler(sys.stdout),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/debug_monitor.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+# Поток записи останавливается при выходе из процесса: записи после cleanup()
+# и при выходе из _acquire_lock (sys.exit) тоже попадают в лог
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Пачечное сохранение новостей: сбрасываем очередь по размеру или по времени
+NEWS_FLUSH_BATCH_SIZE = 32
+NEWS_FLUSH_INTERVAL = 10  # секунд
+
+# Кэш распарсенных ссылок (повторные репосты одной и той же новости)
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_TTL = 3600  # секунд
+TRACKING_QUERY_PARAMS = {'fbclid', 'gclid', 'yclid'}
+
+# Последний подтвержденный update_id канала (чтобы не терять сообщения между перезапусками)
+LAST_UPDATE_ID_FILE = 'logs/last_update_id'
+
+# Сколько последних обработанных сообщений держим в памяти (остальные проверяются по БД)
+PROCESSED_CACHE_SIZE = 10_000
+
+# Количество потоков для парсинга ссылок (опрос Telegram продолжается параллельно)
+PARSE_WORKERS = 2
+# Размер очереди каждого потока: при переполнении опрос ждет (обратное давление)
+WORK_QUEUE_SIZE = 100
+# Сколько ждать текущие сообщения рабочих потоков при остановке (необработанные придут повторно)
+WORKER_JOIN_TIMEOUT = 30  # секунд
+
+# Попыток парсинга одним экземпляром движка до его пересоздания
+ENGINE_PARSE_ATTEMPTS = int(os.getenv("ENGINE_PARSE_ATTEMPTS", "2"))
+
+# Повторов POST к Bot API после ответа 429 (другие ошибки POST не повторяются)
+POST_RETRIES_ON_429 = 2
+
+# Таймаут long polling getUpdates: короткий, чтобы сигнал остановки отрабатывался быстро
+LONG_POLL_TIMEOUT = 5
+
+# Домены, которые заведомо не парсятся (один домен на строку, # - комментарий)
+DEAD_DOMAINS_FILE = 'config/dead_domains.txt'
+
+def _load_dead_domains(path=DEAD_DOMAINS_FILE):
+    """Загрузка списка "мертвых" доменов, для которых сразу создаем базовую новость"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {
+                line.strip().lower() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            }
+    except FileNotFoundError:
+        return set()
+
+_DEAD_DOMAINS = _load_dead_domains()
+
+# Экспоненциальная задержка при ошибках опроса (секунд)
+BACKOFF_MAX_DELAY = 300
+
+# Очередь статусных сообщений: при переполнении новые статусы отбрасываются
+STATUS_QUEUE_SIZE = 256
+
+# Поиск ссылок в тексте сообщения
+_URL_RE = re.compile(r'https?://\S+')
+# Видео на YouTube в тексте новости и хостинги, ссылки на которые Telegram принимает в sendVideo
+_YOUTUBE_RE = re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE)
+_SENDABLE_VIDEO_RE = re.compile(r'youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com', re.IGNORECASE)
+
+
+def _pid_exists(pid: int) -> bool:
+    """Проверяет, существует ли процесс с указанным PID (одним системным вызовом, без tasklist)"""
+    if pid <= 0:
+        return False
+
+    if os.name == 'nt':
+        import ctypes
+        from ctypes import wintypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        ERROR_ACCESS_DENIED = 5
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # Процесс существует, но принадлежит другому пользователю
+            return kernel32.GetLastError() == ERROR_ACCESS_DENIED
+        try:
+            # Открыть можно и завершившийся процесс, пока кто-то держит его дескриптор
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Процесс существует, но принадлежит другому пользователю
+        return True
+    return True
+
+
+def _response_json(response):
+    """Разбор JSON ответа (через orjson, если он установлен)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class ChannelMonitor:
     """Монитор Telegram канала для сохранения новостей в БД"""
 
     def __init__(self):
+        # Флаг остановки (выставляется обработчиком сигналов) и защита от повторной очистки
+        self._stop = threading.Event()
+        self._cleaned = False
+        self._restart_requested = False
+
         # Проверяем единственность экземпляра
         self.lock_file = 'logs/channel_monitor.lock'
         self._acquire_lock()
@@ -62,22 +192,90 @@ class ChannelMonitor:
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"  # Для канала
         self.publish_base_url = f"https://api.telegram.org/bot{self.publish_bot_token}"  # Для группы
 
-        self.last_update_id = 0
+        # Готовые адреса методов Bot API
+        self.url_get_updates = f"{self.base_url}/getUpdates"
+        self.url_group_get_updates = f"{self.publish_base_url}/getUpdates"
+        self.url_send_message = f"{self.publish_base_url}/sendMessage"
+        self.url_send_video = f"{self.publish_base_url}/sendVideo"
+
+        # Общая HTTP-сессия: переиспользуем TCP/TLS соединения к api.telegram.org между запросами
+        self.session = self._create_session()
+        # Опрос админ-группы идет в своем потоке, у него отдельная сессия
+        self.group_session = self._create_session()
+
+        # Статусные сообщения отправляются в фоне, чтобы не задерживать обработку новостей
+        self._status_q = queue.Queue(maxsize=STATUS_QUEUE_SIZE)
+        self._dropped_statuses = 0
+        self._status_thread = threading.Thread(target=self._status_worker, name="status-sender", daemon=True)
+        self._status_thread.start()
+
+        self.last_update_id = self._load_last_update_id()
+        # update_id, выданные в обработку -> обработан ли; offset сдвигается только
+        # по непрерывному префиксу обработанных, остальное Telegram передаст повторно
+        self._unacked_updates = OrderedDict()
+        # Курсор получения: следующий getUpdates запрашивает все после последнего полученного
+        self._fetch_offset = self.last_update_id
         self.last_group_update_id = 0
-        self.processed_messages = set()
+        # Счетчики неудачных попыток опроса: у каждого бота свой
+        self._backoff_attempts = {"channel": 0, "group": 0}
+        # Ограниченный LRU обработанных сообщений перед таблицей processed_messages в БД
+        self.processed_messages = OrderedDict()
+        # Очередь распарсенных новостей, ожидающих сохранения в БД одной транзакцией
+        self._pending_news = deque()
+        self._last_flush = time.monotonic()
+        # Кэш результатов парсинга: нормализованный URL -> (время истечения, данные)
+        self._parse_cache = OrderedDict()
+        # Обработка сообщений идет в рабочих потоках; общее состояние защищено блокировкой
+        self._state_lock = threading.Lock()
+        self._inflight = 0
+        self._abandoned = 0
+        # У каждого потока своя очередь: сообщения с одной ссылкой попадают в один поток
+        # и обрабатываются по порядку (повтор берется из кэша, а не парсится параллельно)
+        self._work_queues = [queue.Queue(maxsize=WORK_QUEUE_SIZE) for _ in range(PARSE_WORKERS)]
+        self._workers = [
+            threading.Thread(target=self._worker, args=(work_q,), name=f"parse-{i}", daemon=True)
+            for i, work_q in enumerate(self._work_queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+        # Очередь новостей сохраняется и по таймеру, даже если рабочие потоки заняты долгим парсингом
+        self._flush_thread = threading.Thread(target=self._flush_timer, name="news-flush", daemon=True)
+        self._flush_thread.start()
+        # Оркестратор обработки новостей создается при первой новости
+        self._orchestrator = None
+        self._orchestrator_lock = threading.Lock()
         self.config_path = 'config/config.yaml'
         
         # Загружаем конфигурацию
         self.config = self._load_config(self.config_path)
         
-        # Очищаем pending updates чтобы избежать 409 конфликтов
-        self._clear_pending_updates()
+        # Очищаем pending updates чтобы избежать 409 конфликтов.
+        # Если offset сохранен с прошлого запуска - продолжаем с него, ничего не теряя
+        if self.last_update_id == 0:
+            self._clear_pending_updates()
+        else:
+            logger.info(f"▶️ Продолжаем с сохраненного update_id: {self.last_update_id}")
 
         # Инициализация компонентов
         self.telegram_bot = NewsTelegramBot(self.config_path)
         
         # Инициализация движков
         self._initialize_engines()
+
+        # Ctrl+C / SIGTERM завершают цикл run() штатно, с однократной очисткой ресурсов
+        self._install_signal_handlers()
+
+    def _install_signal_handlers(self):
+        """Устанавливает обработчики SIGINT/SIGTERM, которые только выставляют флаг остановки"""
+        def _request_stop(signum, frame):
+            self._stop.set()
+
+        try:
+            signal.signal(signal.SIGINT, _request_stop)
+            signal.signal(signal.SIGTERM, _request_stop)
+        except ValueError:
+            # signal.signal доступен только из главного потока
+            logger.warning("⚠️ Обработчики сигналов не установлены (не главный поток)")
     
     def _load_config(self, config_path: str):
         """Загрузка конфигурации"""
@@ -96,6 +294,8 @@ class ChannelMonitor:
     def _initialize_engines(self):
         """Инициализация движков новостных источников"""
         try:
+            # Все экземпляры движков создаются с конфигурацией монитора
+            registry.configure(self.config)
             # Регистрируем движки
             registry.register_engine('politico', PoliticoEngine)
             registry.register_engine('washingtonpost', WashingtonPostEngine)
@@ -128,7 +328,7 @@ class ChannelMonitor:
         """
         try:
             # Получаем подходящий движок
-            engine = registry.get_engine_for_url(url, {})
+            engine = registry.get_engine_for_url(url, self.config)
             
             if not engine:
                 logger.warning(f"Не найден подходящий движок для URL: {url[:50]}...")
@@ -136,7 +336,7 @@ class ChannelMonitor:
             
             # Парсим URL через движок
             logger.info(f"🔍 Парсинг через движок {engine.source_name}: {url[:50]}...")
-            content = engine.parse_url(url)
+            content = self._parse_with_retry(engine, url)
             
             # Извлекаем медиа
             media = engine.extract_media(url, content)
@@ -188,6 +388,22 @@ class ChannelMonitor:
         # Отправляем "пинг" в канал публикации при старте
         self._send_publish_ping()
 
+    def _parse_with_retry(self, engine, url: str):
+        """
+        Парсит URL движком, повторяя попытку на том же экземпляре при разовом сбое.
+        Если все попытки неудачны - экземпляр удаляется из реестра и будет пересоздан для следующего URL.
+        """
+        last_error = None
+        for attempt in range(1, ENGINE_PARSE_ATTEMPTS + 1):
+            try:
+                return engine.parse_url(url)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ Ошибка парсинга движком {engine.source_name} (попытка {attempt}/{ENGINE_PARSE_ATTEMPTS}): {e}")
+
+        registry.discard_engine(engine)
+        raise last_error
+
     def _send_publish_ping(self):
         """Отправляет тестовое сообщение в канал публикации при старте."""
         if not self.publish_channel_id or not self.publish_bot_token:
@@ -195,12 +411,12 @@ class ChannelMonitor:
             return
         
         try:
-            url = f"{self.publish_base_url}/sendMessage"
+            url = self.url_send_message
             payload = {
                 'chat_id': self.publish_channel_id,
                 'text': "✅ Monitor online. Сервисные уведомления активны."
             }
-            response = requests.post(url, json=payload, timeout=5)
+            response = self._post_json(url, payload, timeout=5)
             response.raise_for_status()
             logger.info(f"📡 ping status={response.status_code}: {response.text[:100]}")
         except requests.exceptions.RequestException as e:
@@ -217,19 +433,12 @@ class ChannelMonitor:
                 with open(self.lock_file, 'r') as f:
                     old_pid = int(f.read().strip())
                 
-                # Проверяем, существует ли процесс с таким PID (Windows)
-                import subprocess
-                try:
-                    result = subprocess.run(['tasklist', '/FI', f'PID eq {old_pid}'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if str(old_pid) in result.stdout:
-                        logger.error(f"❌ Другой экземпляр уже запущен (PID: {old_pid})")
-                        raise SystemExit("Другой экземпляр channel_monitor уже запущен!")
-                    else:
-                        logger.info(f"🧹 Удаляем устаревший lock файл (PID {old_pid} не существует)")
-                        os.remove(self.lock_file)
-                except subprocess.TimeoutExpired:
-                    logger.warning("⚠️ Таймаут проверки PID, удаляем lock файл")
+                # Проверяем, существует ли процесс с таким PID
+                if _pid_exists(old_pid):
+                    logger.error(f"❌ Другой экземпляр уже запущен (PID: {old_pid})")
+                    raise SystemExit("Другой экземпляр channel_monitor уже запущен!")
+                else:
+                    logger.info(f"🧹 Удаляем устаревший lock файл (PID {old_pid} не существует)")
                     os.remove(self.lock_file)
             except (ValueError, FileNotFoundError):
                 logger.warning("⚠️ Поврежденный lock файл, удаляем...")
@@ -244,9 +453,6 @@ class ChannelMonitor:
             f.write(str(current_pid))
         
         logger.info(f"🔒 Получена блокировка (PID: {current_pid})")
-        
-        # Регистрируем функцию очистки при выходе
-        atexit.register(self._release_lock)
 
     def _release_lock(self):
         """Освобождение блокировки"""
@@ -257,23 +463,54 @@ class ChannelMonitor:
         except Exception as e:
             logger.warning(f"⚠️ Ошибка освобождения блокировки: {e}")
 
+    def _load_last_update_id(self) -> int:
+        """Загружает сохраненный update_id канала (0, если его нет)"""
+        try:
+            with open(LAST_UPDATE_ID_FILE, 'r') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _save_last_update_id(self):
+        """Атомарно сохраняет текущий update_id канала на диск"""
+        tmp_path = LAST_UPDATE_ID_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(str(self.last_update_id))
+            os.replace(tmp_path, LAST_UPDATE_ID_FILE)
+        except OSError as e:
+            logger.warning(f"⚠️ Не удалось сохранить update_id: {e}")
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """HTTP-сессия к Bot API с пулом соединений и повтором временных ошибок"""
+        session = requests.Session()
+        # Адаптер повторяет только GET (getUpdates) на 5xx и сетевых ошибках с нарастающей паузой.
+        # POST (sendMessage/sendVideo) после таймаута чтения мог уже выполниться - его не повторяем,
+        # 429 разбирается вызывающим кодом (одна пауза по retry_after, без второй в адаптере)
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=frozenset({"GET"}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries)
+        session.mount("https://api.telegram.org", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
     def _clear_pending_updates(self):
         """Очистка pending updates для избежания 409 конфликтов"""
         try:
             logger.info("🧹 Очищаем pending updates...")
-            url = f"{self.base_url}/getUpdates"
+            url = self.url_get_updates
             
             # Получаем все pending updates с большим offset чтобы их "съесть"
-            response = requests.get(url, params={"offset": -1, "timeout": 1}, timeout=5)
+            response = self.session.get(url, params={"offset": -1, "timeout": 1}, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _response_json(response)
                 if data.get("ok") and data.get("result"):
-                    # Если есть updates, получаем последний ID и делаем еще один запрос чтобы их очистить
-                    last_update = data["result"][-1] if data["result"] else None
-                    if last_update:
-                        offset = last_update["update_id"] + 1
-                        requests.get(url, params={"offset": offset, "timeout": 1}, timeout=5)
-                        logger.info(f"✅ Очищены pending updates до ID: {offset}")
+                    # Запоминаем последний ID: следующий getUpdates с offset=ID+1 сам подтвердит очистку
+                    last_update = data["result"][-1]
+                    self.last_update_id = last_update["update_id"]
+                    self._save_last_update_id()
+                    logger.info(f"✅ Очищены pending updates до ID: {self.last_update_id + 1}")
                 else:
                     logger.info("✅ Нет pending updates для очистки")
             else:
@@ -282,80 +519,256 @@ class ChannelMonitor:
             logger.warning(f"⚠️ Ошибка при очистке pending updates: {e}")
     
     def send_status_message(self, message: str):
+        """Постановка статусного сообщения в очередь на отправку (best-effort)"""
+        try:
+            self._status_q.put_nowait(message)
+        except queue.Full:
+            self._dropped_statuses += 1
+
+    def _status_worker(self):
+        """Фоновый поток: отправляет статусные сообщения из очереди"""
+        reported_drops = 0
+        while True:
+            message = self._status_q.get()
+            try:
+                if message is None:
+                    return
+                self._post_status_message(message)
+                if self._dropped_statuses > reported_drops:
+                    logger.warning(f"⚠️ Отброшено статусных сообщений (очередь переполнена): {self._dropped_statuses}")
+                    reported_drops = self._dropped_statuses
+            finally:
+                self._status_q.task_done()
+
+    def _post_status_message(self, message: str):
         """Отправка статусного сообщения в канал публикации"""
         try:
-            url = f"{self.publish_base_url}/sendMessage"
+            url = self.url_send_message
             data = {"chat_id": self.publish_channel_id, "text": f"[MONITOR] {message}", "disable_notification": True}
-            requests.post(url, json=data, timeout=15)
+            self._post_json(url, data, timeout=15)
         except Exception as e:
             logger.error(f"Error sending status: {e}")
 
+    def _post_json(self, url: str, payload: dict, timeout: float):
+        """POST с JSON телом через общую сессию (сериализация через orjson, если доступен).
+        Повторяется только ответ 429: такой запрос Telegram не выполнил, дубля не будет"""
+        if orjson is not None:
+            body = {"data": orjson.dumps(payload), "headers": {"Content-Type": "application/json"}}
+        else:
+            body = {"json": payload}
+        for attempt in range(POST_RETRIES_ON_429 + 1):
+            response = self.session.post(url, timeout=timeout, **body)
+            if response.status_code != 429 or attempt == POST_RETRIES_ON_429:
+                return response
+            delay = self._retry_after(response) or 1.0
+            logger.info(f"⏳ Telegram просит подождать {delay:.0f} с перед повтором POST")
+            if self._stop.wait(delay):
+                return response
+
+    def _backoff_sleep(self, poller: str = "channel", retry_after: float = None):
+        """Пауза с экспоненциальным ростом и случайным разбросом; сбрасывается после успешного опроса.
+        Если Telegram вернул retry_after (HTTP 429) - ждем ровно столько, сколько он просит."""
+        if retry_after:
+            delay = float(retry_after)
+            logger.info(f"⏳ Telegram просит подождать {delay:.0f} с ({poller})")
+        else:
+            attempt = self._backoff_attempts[poller]
+            delay = min(BACKOFF_MAX_DELAY, 2 ** attempt) * random.uniform(0.5, 1.5)
+            self._backoff_attempts[poller] = attempt + 1
+            logger.info(f"⏳ Повтор через {delay:.1f} с (попытка {attempt + 1}, {poller})")
+        self._stop.wait(delay)
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        """Значение retry_after из ответа Bot API на 429 (тело ответа или заголовок Retry-After)"""
+        try:
+            retry_after = (_response_json(response).get("parameters") or {}).get("retry_after")
+        except ValueError:
+            retry_after = None
+        if retry_after is None:
+            retry_after = response.headers.get("Retry-After")
+        try:
+            return float(retry_after) if retry_after is not None else None
+        except ValueError:
+            return None
+
     def get_updates(self):
         """Получение обновлений из канала и группы"""
-        url = f"{self.base_url}/getUpdates"
-        params = {"offset": self.last_update_id + 1, "timeout": 30, "allowed_updates": ["channel_post", "message"]}
+        url = self.url_get_updates
+        with self._state_lock:
+            offset = max(self._fetch_offset, self.last_update_id) + 1
+        params = {"offset": offset, "timeout": LONG_POLL_TIMEOUT, "limit": 100, "allowed_updates": ["channel_post", "message"]}
         try:
-            response = requests.get(url, params=params, timeout=35)
+            response = self.session.get(url, params=params, timeout=LONG_POLL_TIMEOUT + 5)
             
             # Специальная обработка 409 конфликта
             if response.status_code == 409:
                 logger.warning("🔄 Обнаружен конфликт (409), очищаем pending updates...")
                 self._clear_pending_updates()
-                time.sleep(5)
+                self._backoff_sleep()
+                return
+            
+            if response.status_code == 429:
+                logger.warning("⚠️ Слишком много запросов (429) при получении обновлений")
+                self._backoff_sleep(retry_after=self._retry_after(response))
                 return
             
             response.raise_for_status()
-            data = response.json()
+            data = _response_json(response)
+            if data.get("ok"):
+                self._backoff_attempts["channel"] = 0
             if data.get("ok") and data.get("result"):
-                for update in data["result"]:
-                    self.last_update_id = update["update_id"]
-                    yield update
+                # Опрос идет дальше сразу, а в файл для рестарта попадает только
+                # непрерывный префикс обработанных update (_ack_update)
+                with self._state_lock:
+                    fresh = [update for update in data["result"]
+                             if update["update_id"] > max(self._fetch_offset, self.last_update_id)]
+                    for update in fresh:
+                        self._unacked_updates[update["update_id"]] = False
+                    if fresh:
+                        self._fetch_offset = fresh[-1]["update_id"]
+                yield from fresh
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 409:
                 logger.warning("🔄 HTTP 409 конфликт, очищаем pending updates...")
                 self._clear_pending_updates()
-                time.sleep(5)
+                self._backoff_sleep()
             else:
                 logger.warning(f"HTTP error getting updates: {e}, will retry...")
-                time.sleep(10)
+                self._backoff_sleep()
         except requests.exceptions.RequestException as e:
             logger.warning(f"Network error getting updates: {e}, will retry...")
-            time.sleep(10)
+            self._backoff_sleep()
         except Exception as e:
             logger.error(f"Unhandled error getting updates: {e}")
-            time.sleep(15)
+            self._backoff_sleep()
+
+    def _ack_update(self, update_id):
+        """Отмечает update обработанным и сохраняет offset, если перед ним не осталось необработанных"""
+        if update_id is None:
+            return
+        with self._state_lock:
+            if update_id in self._unacked_updates:
+                self._unacked_updates[update_id] = True
+            advanced = False
+            while self._unacked_updates:
+                first_id, done = next(iter(self._unacked_updates.items()))
+                if not done:
+                    break
+                self._unacked_updates.popitem(last=False)
+                if first_id > self.last_update_id:
+                    self.last_update_id = first_id
+                    advanced = True
+            if advanced:
+                self._save_last_update_id()
 
     def get_group_updates(self):
         """Получение обновлений из админ-группы через publish-бота."""
-        url = f"{self.publish_base_url}/getUpdates"
-        params = {"offset": self.last_group_update_id + 1, "timeout": 30, "allowed_updates": ["message"]}
+        url = self.url_group_get_updates
+        params = {"offset": self.last_group_update_id + 1, "timeout": LONG_POLL_TIMEOUT, "limit": 100, "allowed_updates": ["message"]}
         try:
-            response = requests.get(url, params=params, timeout=35)
+            response = self.group_session.get(url, params=params, timeout=LONG_POLL_TIMEOUT + 5)
             if response.status_code == 409:
                 # для второго бота чистим его очередь отдельно
                 try:
-                    requests.get(url, params={"offset": -1, "timeout": 1}, timeout=5)
+                    self.group_session.get(url, params={"offset": -1, "timeout": 1}, timeout=5)
                 except Exception:
                     pass
-                time.sleep(5)
+                self._backoff_sleep("group")
+                return
+            if response.status_code == 429:
+                logger.warning("⚠️ Слишком много запросов (429) при получении команд группы")
+                self._backoff_sleep("group", retry_after=self._retry_after(response))
                 return
             response.raise_for_status()
-            data = response.json()
+            data = _response_json(response)
+            if data.get("ok"):
+                self._backoff_attempts["group"] = 0
             if data.get("ok") and data.get("result"):
-                for update in data["result"]:
-                    self.last_group_update_id = update["update_id"]
-                    yield update
+                self.last_group_update_id = max(update["update_id"] for update in data["result"])
+                yield from data["result"]
         except Exception as e:
             logger.warning(f"Group updates error: {e}")
-            time.sleep(10)
+            self._backoff_sleep("group")
+
+    def _is_processed(self, message_id) -> bool:
+        """Проверяет, обрабатывалось ли сообщение (в памяти, затем в БД - переживает перезапуск)"""
+        with self._state_lock:
+            if message_id in self.processed_messages:
+                self.processed_messages.move_to_end(message_id)
+                return True
+        try:
+            if self.telegram_bot._is_message_processed(str(message_id)):
+                with self._state_lock:
+                    self._remember_processed(message_id)
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ Ошибка проверки обработанного сообщения {message_id}: {e}")
+        return False
+
+    def _remember_processed(self, message_id):
+        """Добавляет сообщение в LRU обработанных, вытесняя самые старые (вызывать под _state_lock)"""
+        self.processed_messages[message_id] = None
+        self.processed_messages.move_to_end(message_id)
+        while len(self.processed_messages) > PROCESSED_CACHE_SIZE:
+            self.processed_messages.popitem(last=False)
+
+    def _mark_processed(self, message_id):
+        """Отмечает сообщение как обработанное в памяти и в БД"""
+        with self._state_lock:
+            self._remember_processed(message_id)
+        try:
+            self.telegram_bot._mark_message_processed(str(message_id))
+        except Exception as e:
+            logger.warning(f"⚠️ Не удалось сохранить отметку об обработке {message_id}: {e}")
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Нормализует URL для ключа кэша: хост в нижнем регистре, без трекинг-параметров и фрагмента"""
+        parts = urlparse(url)
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in TRACKING_QUERY_PARAMS
+        ])
+        return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.params, query, ''))
+
+    def _get_cached_parse(self, key: str):
+        """Возвращает копию результата парсинга из кэша или None"""
+        with self._state_lock:
+            entry = self._parse_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at < time.monotonic():
+                del self._parse_cache[key]
+                return None
+            self._parse_cache.move_to_end(key)
+            return dict(data)
+
+    def _store_cached_parse(self, key: str, data: dict):
+        """Сохраняет результат парсинга в кэш, вытесняя самые старые записи"""
+        with self._state_lock:
+            self._parse_cache[key] = (time.monotonic() + PARSE_CACHE_TTL, dict(data))
+            self._parse_cache.move_to_end(key)
+            while len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+    def _drop_cached_parse(self, key: str):
+        """Удаляет результат парсинга из кэша"""
+        with self._state_lock:
+            self._parse_cache.pop(key, None)
+
+    def process_channel_message(self, message: dict, update_id=None) -> bool:
+        """Обработка сообщения из канала: парсинг и сохранение в БД.
 
-    def process_channel_message(self, message: dict):
-        """Обработка сообщения из канала: парсинг и сохранение в БД."""
+        Возвращает True, если новость поставлена в очередь на сохранение:
+        тогда update подтверждается после сохранения (_flush_news), иначе - сразу."""
         message_id = message.get("message_id")
-        if not message_id or message_id in self.processed_messages:
-            return
+        if not message_id or self._is_processed(message_id):
+            return False
 
         text = message.get("text", "").strip() or message.get("caption", "").strip()
+        now_iso = datetime.now().isoformat()
         
         # Проверяем наличие медиа без текста
         has_media = bool(message.get('photo') or message.get('video') or 
@@ -363,38 +776,49 @@ class ChannelMonitor:
         
         if not text and not has_media:
             logger.info(f"⏭️ Пропускаем сообщение {message_id}: нет текста и медиа")
-            return
+            return False
 
         logger.info(f"New message received (ID: {message_id}): {text[:100] if text else '[media only]'}...")
         self.send_status_message(f"Received: {text[:50] if text else '[media]'}...")
 
         try:
-            url_pattern = r'https?://[^\s]+'
-            urls = re.findall(url_pattern, text) if text else []
+            # Используется только первая ссылка, остальные не ищем
+            url_match = _URL_RE.search(text) if text else None
             
-            if urls:
-                url = urls[0]
+            if url_match:
+                url = url_match.group(0)
                 logger.info(f"🌐 Parsing URL: {url}")
+                parsed_url = urlparse(url)
+                host = parsed_url.netloc.lower()
                 
-                # Сначала пробуем парсить через движки
-                parsed_data = None
-                try:
-                    parsed_data = self._parse_url_with_engines(url)
-                    if parsed_data:
-                        logger.info("✅ URL обработан через движки")
-                    else:
-                        logger.info("❌ Движки забраковали URL - новость не подходит для обработки")
-                        # НЕ переключаемся на старый парсер - если движок забраковал, значит контент не подходит
-                        return
-                except Exception as e:
-                    logger.warning(f"Ошибка парсинга через движки: {e}")
-                    logger.info("🔄 Переключаемся на базовую обработку...")
-                    
+                # Повторные ссылки берем из кэша, чтобы не парсить страницу заново
+                cache_key = self._normalize_url(url)
+                parsed_data = self._get_cached_parse(cache_key)
+                if parsed_data:
+                    logger.info("♻️ URL найден в кэше парсинга")
+                elif host in _DEAD_DOMAINS:
+                    # Заведомо недоступный домен - не тратим время на движки и Selenium
+                    logger.info(f"⏭️ Домен {host} в списке недоступных, пропускаем парсинг")
+                else:
+                    # Сначала пробуем парсить через движки
                     try:
-                        # Используем базовую обработку через telegram_bot
-                        parsed_data = self.telegram_bot._parse_url_with_engines(url)
-                    except Exception as e2:
-                        logger.warning(f"Ошибка базовой обработки: {e2}")
+                        parsed_data = self._parse_url_with_engines(url)
+                        if parsed_data:
+                            logger.info("✅ URL обработан через движки")
+                            self._store_cached_parse(cache_key, parsed_data)
+                        else:
+                            logger.info("❌ Движки забраковали URL - новость не подходит для обработки")
+                            # НЕ переключаемся на старый парсер - если движок забраковал, значит контент не подходит
+                            return False
+                    except Exception as e:
+                        logger.warning(f"Ошибка парсинга через движки: {e}")
+                        logger.info("🔄 Переключаемся на базовую обработку...")
+                        
+                        try:
+                            # Используем базовую обработку через telegram_bot
+                            parsed_data = self.telegram_bot._parse_url_with_engines(url)
+                        except Exception as e2:
+                            logger.warning(f"Ошибка базовой обработки: {e2}")
                 
                 if parsed_data and parsed_data.get('success') and parsed_data.get('title'):
                     news_data = parsed_data
@@ -445,14 +869,15 @@ class ChannelMonitor:
                 else:
                     # Создаем базовую новость даже при полном сбое парсинга
                     logger.warning(f"⚠️ Не удалось полностью спарсить {url}, создаем базовую новость")
+                    self._drop_cached_parse(cache_key)
                     news_data = {
                         'url': url,
-                        'title': f"Новость: {url.split('/')[-1][:50]}",
+                        'title': f"Новость: {parsed_url.path.rstrip('/').rsplit('/', 1)[-1][:50]}",
                         'description': f"Ссылка на новость: {url}. Полное содержимое недоступно из-за ограничений сайта.",
                         'content': f"Оригинальная ссылка: {url}",
-                        'source': urlparse(url).netloc if url else 'Unknown',
+                        'source': parsed_url.netloc or 'Unknown',
                         'content_type': 'news',
-                        'published': datetime.now().isoformat(),
+                        'published': now_iso,
                         'parsing_failed': True
                     }
             else:
@@ -489,7 +914,7 @@ class ChannelMonitor:
                                     logger.warning(f"⚠️ Ошибка обработки медиа Telegram поста: {e}")
                             else:
                                 logger.warning("❌ Не удалось обработать Telegram пост")
-                                return
+                                return False
                         else:
                             logger.error("❌ Не найден движок для Telegram постов")
                             # Fallback к старой логике
@@ -515,35 +940,16 @@ class ChannelMonitor:
                         }
                 else:
                     logger.info(f"⏭️ Текст слишком короткий ({len(text) if text else 0} символов), пропускаем")
-                    return
+                    return False
 
             # Добавляем стандартные поля, если их нет
             news_data.setdefault('source', 'Unknown')
             news_data.setdefault('content_type', 'news')
-            news_data.setdefault('published', datetime.now().isoformat())
+            news_data.setdefault('published', now_iso)
 
-            # Сохраняем новость в БД через telegram_bot
-            news_id = self.telegram_bot._save_parsed_news(news_data, 0, self.monitor_channel_id)
-            if news_id:
-                logger.info(f"✅ News saved to DB with ID: {news_id}")
-                self.send_status_message(f"✅ Saved to DB (ID: {news_id}): {news_data['title'][:40]}...")
-                
-                # Проверяем, есть ли видео в новости, на основе результата от media_manager
-                has_video = news_data.get('has_video', False)
-                
-                if has_video:
-                    # Если есть видео, отправляем запрос на указание времени старта
-                    self.send_video_start_request(news_id, news_data)
-                    logger.info(f"🎬 Новость {news_id} содержит видео, ожидаем команду /startat")
-                else:
-                    # Если видео нет, запускаем обработку автоматически
-                    logger.info(f"🚀 Новость {news_id} не содержит видео, запускаем обработку автоматически...")
-                    self.send_status_message(f"🚀 Автоматический запуск обработки для новости ID {news_id} (нет видео).")
-                    self.trigger_news_processing(news_id)
-                    self.processed_messages.add(message_id)
-            else:
-                logger.error("Failed to save news to database.")
-                self.send_status_message("❌ Error saving to DB.")
+            # Ставим новость в очередь на пачечное сохранение в БД
+            self._enqueue_news(news_data, message_id, update_id)
+            return True
 
         except Exception as e:
             logger.error(f"Failed to process message {message_id}: {e}", exc_info=True)
@@ -557,6 +963,139 @@ class ChannelMonitor:
             except:
                 pass # Ignore errors in the error dumper
             self.send_status_message(f"❌ Error processing message: {e}")
+            return False
+
+    def _submit_channel_message(self, message: dict, update_id=None):
+        """Передает сообщение канала рабочему потоку, не блокируя опрос Telegram"""
+        text = message.get("text", "").strip() or message.get("caption", "").strip()
+        url_match = _URL_RE.search(text) if text else None
+        key = self._normalize_url(url_match.group(0)) if url_match else str(message.get("message_id"))
+        work_q = self._work_queues[hash(key) % len(self._work_queues)]
+        with self._state_lock:
+            self._inflight += 1
+        while not self._stop.is_set():
+            try:
+                work_q.put((message, update_id), timeout=1)
+                return
+            except queue.Full:
+                continue
+        # Остановка: сообщение не подтверждено, Telegram передаст его повторно после перезапуска
+        with self._state_lock:
+            self._inflight -= 1
+
+    def _worker(self, work_q: queue.Queue):
+        """Рабочий поток: обрабатывает сообщения из своей очереди до получения None или остановки"""
+        while True:
+            item = work_q.get()
+            try:
+                if item is None:
+                    return
+                if self._stop.is_set():
+                    # Остановка: сообщение не подтверждено и придет повторно
+                    with self._state_lock:
+                        self._abandoned += 1
+                    return
+                self._process_message_task(*item)
+            except Exception as e:
+                logger.error(f"Ошибка обработки сообщения в рабочем потоке: {e}", exc_info=True)
+            finally:
+                work_q.task_done()
+
+    def _process_message_task(self, message: dict, update_id=None):
+        """Обработка сообщения; когда все потоки простаивают - сохраняем накопленное в БД"""
+        queued = False
+        try:
+            queued = self.process_channel_message(message, update_id)
+        finally:
+            if not queued:
+                self._ack_update(update_id)
+            with self._state_lock:
+                self._inflight -= 1
+                idle = self._inflight == 0
+            if idle:
+                self._flush_news()
+
+    def _enqueue_news(self, news_data: dict, message_id, update_id=None):
+        """Добавляет новость в очередь и сбрасывает ее в БД при достижении порога"""
+        with self._state_lock:
+            self._pending_news.append((news_data, message_id, update_id))
+            should_flush = (len(self._pending_news) >= NEWS_FLUSH_BATCH_SIZE
+                            or time.monotonic() - self._last_flush > NEWS_FLUSH_INTERVAL)
+        if should_flush:
+            self._flush_news()
+
+    def _flush_timer(self):
+        """Фоновый поток: сохраняет очередь новостей, ждущую дольше NEWS_FLUSH_INTERVAL"""
+        while not self._stop.wait(1):
+            with self._state_lock:
+                due = bool(self._pending_news) and time.monotonic() - self._last_flush > NEWS_FLUSH_INTERVAL
+            if due:
+                try:
+                    self._flush_news()
+                except Exception as e:
+                    logger.error(f"Ошибка сохранения очереди новостей по таймеру: {e}", exc_info=True)
+
+    def _flush_news(self, final: bool = False):
+        """Сохраняет накопленные новости в БД одной транзакцией и запускает их обработку.
+
+        После остановки очередь сохраняет только финальный вызов из cleanup() (final=True),
+        когда рабочие потоки уже завершены."""
+        if self._stop.is_set() and not final:
+            return
+        with self._state_lock:
+            self._last_flush = time.monotonic()
+            if not self._pending_news:
+                return
+            batch = list(self._pending_news)
+            self._pending_news.clear()
+
+        try:
+            news_ids = self.telegram_bot._save_parsed_news_batch(
+                [news_data for news_data, _, _ in batch], 0, self.monitor_channel_id
+            )
+            logger.info(f"💾 Сохранено новостей одной транзакцией: {len(news_ids)}")
+        except Exception as e:
+            # Одна плохая строка откатывает всю транзакцию - сохраняем пачку по одной новости
+            logger.warning(f"⚠️ Пачка из {len(batch)} новостей не сохранилась ({e}), сохраняем по одной")
+            news_ids = [self._save_single_news(news_data) for news_data, _, _ in batch]
+
+        for (news_data, message_id, update_id), news_id in zip(batch, news_ids):
+            try:
+                if news_id is not None:
+                    self._on_news_saved(news_id, news_data, message_id)
+            except Exception as e:
+                logger.error(f"Failed to process saved news {news_id}: {e}", exc_info=True)
+                self.send_status_message(f"❌ Error processing news {news_id}: {e}")
+            finally:
+                self._ack_update(update_id)
+
+    def _save_single_news(self, news_data: dict):
+        """Сохраняет одну новость в БД; None, если не удалось"""
+        try:
+            return self.telegram_bot._save_parsed_news(news_data, 0, self.monitor_channel_id)
+        except Exception as e:
+            logger.error(f"Failed to save news to database: {e}")
+            self.send_status_message(f"❌ Error saving to DB: {news_data.get('title', '')[:40]}...")
+            return None
+
+    def _on_news_saved(self, news_id: int, news_data: dict, message_id):
+        """Действия после сохранения новости: статус, запрос старта видео или запуск обработки"""
+        logger.info(f"✅ News saved to DB with ID: {news_id}")
+        self.send_status_message(f"✅ Saved to DB (ID: {news_id}): {news_data['title'][:40]}...")
+
+        # Проверяем, есть ли видео в новости, на основе результата от media_manager
+        has_video = news_data.get('has_video', False)
+
+        if has_video:
+            # Если есть видео, отправляем запрос на указание времени старта
+            self.send_video_start_request(news_id, news_data)
+            logger.info(f"🎬 Новость {news_id} содержит видео, ожидаем команду /startat")
+        else:
+            # Если видео нет, запускаем обработку автоматически
+            logger.info(f"🚀 Новость {news_id} не содержит видео, запускаем обработку автоматически...")
+            self.send_status_message(f"🚀 Автоматический запуск обработки для новости ID {news_id} (нет видео).")
+            self.trigger_news_processing(news_id)
+            self._mark_processed(message_id)
 
     def send_video_start_request(self, news_id: int, news_data: dict):
         """Отправляет запрос на указание времени старта видео в группу с превью видео."""
@@ -566,7 +1105,7 @@ class ChannelMonitor:
             if news_data.get('videos'):
                 video_url = news_data['videos'][0]
                 video_info = f"🎥 Видео найдено: {video_url}"
-            elif 'youtube.com' in news_data.get('content', '') or 'youtu.be' in news_data.get('content', ''):
+            elif _YOUTUBE_RE.search(news_data.get('content') or ''):
                 video_info = "🎥 YouTube видео обнаружено в контенте"
             else:
                 video_info = "🎥 Видео найдено в контенте"
@@ -586,7 +1125,7 @@ class ChannelMonitor:
             can_send_video = False
             if video_url:
                 # Проверяем, поддерживает ли Telegram этот URL напрямую
-                if any(domain in video_url for domain in ['youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com']):
+                if _SENDABLE_VIDEO_RE.search(video_url):
                     can_send_video = True
                 else:
                     # Для Twitter и других источников отправляем как ссылку
@@ -594,7 +1133,7 @@ class ChannelMonitor:
             
             if can_send_video and video_url:
                 # Отправляем видео с превью для поддерживаемых источников
-                url = f"{self.publish_base_url}/sendVideo"
+                url = self.url_send_video
                 data = {
                     "chat_id": self.publish_channel_id,
                     "video": video_url,
@@ -604,7 +1143,7 @@ class ChannelMonitor:
                 }
             else:
                 # Отправляем обычное сообщение с ссылкой на видео
-                url = f"{self.publish_base_url}/sendMessage"
+                url = self.url_send_message
                 data = {
                     "chat_id": self.publish_channel_id,
                     "text": message,
@@ -612,7 +1151,7 @@ class ChannelMonitor:
                     "disable_notification": False
                 }
             
-            response = requests.post(url, json=data, timeout=10)
+            response = self._post_json(url, data, timeout=10)
             response.raise_for_status()
             logger.info(f"✅ Запрос на время старта отправлен для новости {news_id}")
             
@@ -645,13 +1184,13 @@ class ChannelMonitor:
             
             # Отправляем подтверждение
             confirm_message = f"✅ Установлено время старта {start_seconds}с для новости {news_id}\n🚀 Запускаем обработку..."
-            url = f"{self.publish_base_url}/sendMessage"
+            url = self.url_send_message
             data = {
                 "chat_id": self.publish_channel_id,
                 "text": confirm_message,
                 "disable_notification": False
             }
-            requests.post(url, json=data, timeout=10)
+            self._post_json(url, data, timeout=10)
             
             logger.info(f"✅ Команда /startat обработана: новость {news_id}, старт {start_seconds}с")
             
@@ -669,19 +1208,17 @@ class ChannelMonitor:
         try:
             logger.info(f"🚀 Запускаем обработку новости {news_id} с установленным смещением...")
             
-            # Импортируем и запускаем основной обработчик напрямую
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-            
-            from scripts.main_orchestrator import ShortsNewsOrchestrator
-            
-            # Создаем оркестратор
-            orchestrator = ShortsNewsOrchestrator('config/config.yaml')
-            orchestrator.initialize_components()
-            
-            # Обрабатываем новость
-            success = orchestrator.process_news_by_id(news_id)
+            # Оркестратор создается один раз и переиспользуется (LLM, экспорт видео, YouTube);
+            # новости обрабатываются им последовательно
+            with self._orchestrator_lock:
+                if self._orchestrator is None:
+                    from scripts.main_orchestrator import ShortsNewsOrchestrator
+                    orchestrator = ShortsNewsOrchestrator('config/config.yaml')
+                    orchestrator.initialize_components()
+                    self._orchestrator = orchestrator
+                
+                # Обрабатываем новость
+                success = self._orchestrator.process_news_by_id(news_id)
             
             if success:
                 logger.info(f"✅ Новость {news_id} успешно обработана")
@@ -693,16 +1230,98 @@ class ChannelMonitor:
             logger.error(f"❌ Ошибка запуска обработки новости {news_id}: {e}")
             self.send_status_message(f"❌ Ошибка запуска обработки новости {news_id}")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Единственная точка освобождения ресурсов и блокировки при выходе
+        self.cleanup()
+        return False
+
     def cleanup(self):
-        """Очистка ресурсов при завершении работы"""
+        """Очистка ресурсов при завершении работы (повторные вызовы игнорируются)"""
+        if self._cleaned:
+            return
+        self._cleaned = True
         logger.info("🧹 Очистка ресурсов...")
+
+        # Останавливаем опрос, таймер сохранения и рабочие потоки
+        self._stop.set()
+
+        try:
+            # Новые сообщения потоки не берут (их updates не подтверждены), ждем только текущие
+            if hasattr(self, '_workers'):
+                for work_q in self._work_queues:
+                    try:
+                        work_q.put_nowait(None)
+                    except queue.Full:
+                        pass  # поток увидит флаг остановки после текущего сообщения
+                deadline = time.monotonic() + WORKER_JOIN_TIMEOUT
+                for worker in self._workers:
+                    worker.join(timeout=max(0.0, deadline - time.monotonic()))
+                busy = [worker.name for worker in self._workers if worker.is_alive()]
+                if busy:
+                    logger.warning(f"⚠️ Рабочие потоки не завершились за {WORKER_JOIN_TIMEOUT} с: {', '.join(busy)}")
+                abandoned = self._abandoned
+                for work_q in self._work_queues:
+                    while True:
+                        try:
+                            abandoned += work_q.get_nowait() is not None
+                        except queue.Empty:
+                            break
+                if abandoned:
+                    logger.info(f"↩️ Не обработано сообщений: {abandoned}, Telegram передаст их повторно")
+        except Exception as e:
+            logger.warning(f"Ошибка остановки рабочих потоков: {e}")
+
+        if hasattr(self, '_flush_thread'):
+            self._flush_thread.join(timeout=NEWS_FLUSH_INTERVAL)
+        try:
+            # Разобранные сообщения уже получили статус и скачанные медиа: сохраняем их
+            # и подтверждаем, иначе после перезапуска все это повторится
+            if getattr(self, '_pending_news', None):
+                logger.info(f"💾 Сохраняем оставшиеся новости: {len(self._pending_news)}")
+                self._flush_news(final=True)
+        except Exception as e:
+            logger.warning(f"Ошибка сохранения оставшихся новостей: {e}")
         
+        try:
+            # Закрываем оркестратор (Selenium экспортера видео и т.п.)
+            if getattr(self, '_orchestrator', None) is not None:
+                self._orchestrator.cleanup()
+        except Exception as e:
+            logger.warning(f"Ошибка закрытия оркестратора: {e}")
+
         try:
             # Закрываем telegram_bot
             if hasattr(self, 'telegram_bot') and self.telegram_bot:
+                if hasattr(self.telegram_bot, 'close'):
+                    self.telegram_bot.close()
                 logger.info("✓ Telegram Bot закрыт")
         except Exception as e:
             logger.warning(f"Ошибка закрытия Telegram Bot: {e}")
+
+        try:
+            # Дожидаемся отправки оставшихся статусных сообщений
+            if hasattr(self, '_status_thread') and self._status_thread.is_alive():
+                self._status_q.put(None, timeout=5)
+                self._status_thread.join(timeout=10)
+        except Exception as e:
+            logger.warning(f"Ошибка остановки отправки статусов: {e}")
+
+        try:
+            # Закрываем HTTP-сессию
+            if hasattr(self, 'session') and self.session:
+                self.session.close()
+            if hasattr(self, 'group_session') and self.group_session:
+                self.group_session.close()
+        except Exception as e:
+            logger.warning(f"Ошибка закрытия HTTP-сессии: {e}")
+
+        # Освобождаем блокировку
+        self._release_lock()
+
+        logger.info("✅ Очистка завершена")
     
     def _rename_part_files(self):
         """Переименовывает .part файлы в .mp4 при запуске"""
@@ -729,34 +1348,6 @@ class ChannelMonitor:
                 logger.info("✅ .part файлов не найдено")
         except Exception as e:
             logger.warning(f"❌ Ошибка переименования .part файлов: {e}")
-        
-        try:
-            # Закрываем telegram_bot
-            if hasattr(self, 'telegram_bot') and self.telegram_bot:
-                if hasattr(self.telegram_bot, 'close'):
-                    self.telegram_bot.close()
-                logger.info("✓ TelegramBot закрыт")
-        except Exception as e:
-            logger.warning(f"Ошибка закрытия TelegramBot: {e}")
-        
-        # Освобождаем блокировку
-        self._release_lock()
-        
-        # Принудительная сборка мусора
-        try:
-            import gc
-            gc.collect()
-        except:
-            pass
-        
-        logger.info("✅ Очистка завершена")
-
-    def __del__(self):
-        """Деструктор для автоматической очистки ресурсов"""
-        try:
-            self.cleanup()
-        except Exception:
-            pass
 
     def handle_sandbox_toggle(self, enabled: bool):
         """Toggles the sandbox mode in the config file."""
@@ -805,16 +1396,17 @@ class ChannelMonitor:
         update_id = update.get('update_id')
         if update_id:
             try:
-                url = f"{self.publish_base_url}/getUpdates"
+                url = self.url_group_get_updates
                 params = {"offset": update_id + 1, "timeout": 1}
-                requests.get(url, params=params, timeout=5)
+                self.group_session.get(url, params=params, timeout=5)
                 logger.info(f"✅ Команда остановки (update_id: {update_id}) была отмечена как обработанная.")
                 time.sleep(2)  # Add a small delay
             except Exception as e:
                 logger.warning(f"⚠️ Не удалось отметить команду остановки как обработанную: {e}")
 
-        # The atexit handler will call cleanup and release the lock.
-        sys.exit(0)
+        # Команда приходит в потоке опроса группы: останавливаем основной цикл,
+        # очистку и освобождение блокировки выполнит run()
+        self._stop.set()
 
     def handle_restart_command(self, update: dict):
         """Handles the /restart_monitor command."""
@@ -825,40 +1417,42 @@ class ChannelMonitor:
         update_id = update.get('update_id')
         if update_id:
             try:
-                url = f"{self.publish_base_url}/getUpdates"
+                url = self.url_group_get_updates
                 params = {"offset": update_id + 1, "timeout": 1}
-                requests.get(url, params=params, timeout=5)
+                self.group_session.get(url, params=params, timeout=5)
                 logger.info(f"✅ Команда перезапуска (update_id: {update_id}) была отмечена как обработанная.")
                 time.sleep(2) # Add a small delay to allow Telegram to process the offset
             except Exception as e:
                 logger.warning(f"⚠️ Не удалось отметить команду перезапуска как обработанную: {e}")
 
-        # Explicitly release lock before restarting
-        try:
-            self._release_lock()
-        except Exception as e:
-            logger.warning(f"Ошибка при освобождении блокировки перед перезапуском: {e}")
-
-        # Replace the current process with a new one
-        os.execv(sys.executable, ['python'] + sys.argv)
+        # Перезапуск идет через обычную остановку: run() дождется обработки принятых сообщений,
+        # сохранит очередь новостей, освободит блокировку и только потом заменит процесс
+        self._restart_requested = True
+        self._stop.set()
 
-    def run(self):
-        """Основной цикл мониторинга."""
-        logger.info("Starting channel monitoring...")
-        logger.info("Press Ctrl+C to stop.")
-        self.send_status_message("🚀 Monitor service started.")
-
-        while True:
+    def _poll_channel(self):
+        """Поток опроса канала (через @tubepull_bot): сообщения уходят рабочим потокам"""
+        while not self._stop.is_set():
             try:
-                # 1) Обработка сообщений из канала (через @tubepull_bot)
                 for update in self.get_updates():
                     if "channel_post" in update:
                         message = update["channel_post"]
                         chat_id = message.get("chat", {}).get("id")
                         if str(chat_id) == str(self.monitor_channel_id):
-                            self.process_channel_message(message)
-                
-                # 2) Обработка команд из группы (через @tubepush_bot)
+                            self._submit_channel_message(message, update["update_id"])
+                            continue
+                    # Остальные обновления не обрабатываются - подтверждаем сразу
+                    self._ack_update(update["update_id"])
+                # Без паузы: getUpdates - long polling, сервер сам держит запрос до прихода обновлений
+            except Exception as e:
+                logger.error(f"Critical error in channel polling: {e}", exc_info=True)
+                self.send_status_message(f"CRITICAL ERROR: {e}")
+                self._backoff_sleep()
+
+    def _poll_group(self):
+        """Поток опроса админ-группы (через @tubepush_bot): команды управления и /startat"""
+        while not self._stop.is_set():
+            try:
                 for update in self.get_group_updates():
                     if "message" in update:
                         message = update["message"]
@@ -870,10 +1464,10 @@ class ChannelMonitor:
                             # Обработка команд управления
                             if text == '/stop_monitor':
                                 self.handle_stop_command(update)
-                                return # Exit the loop and script
+                                return
                             elif text == '/restart_monitor':
                                 self.handle_restart_command(update)
-                                return # execv replaces the process
+                                return
                             elif text == '/sandbox_on':
                                 self.handle_sandbox_toggle(True)
                             elif text == '/sandbox_off':
@@ -884,23 +1478,54 @@ class ChannelMonitor:
                                 # Команда обработана, добавляем сообщение в processed
                                 message_id = message.get("message_id")
                                 if message_id:
-                                    self.processed_messages.add(f"group_{message_id}")
-                                    
-                time.sleep(5)  # Пауза между проверками
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user.")
-                self.send_status_message("🛑 Monitor service stopped.")
-                self.cleanup()
-                break
+                                    self._mark_processed(f"group_{message_id}")
             except Exception as e:
-                logger.error(f"Critical error in monitoring loop: {e}", exc_info=True)
+                logger.error(f"Critical error in group polling: {e}", exc_info=True)
                 self.send_status_message(f"CRITICAL ERROR: {e}")
-                time.sleep(20)
+                self._backoff_sleep("group")
+
+    def run(self):
+        """Основной цикл мониторинга."""
+        logger.info("Starting channel monitoring...")
+        logger.info("Press Ctrl+C to stop.")
+        self.send_status_message("🚀 Monitor service started.")
+
+        # Оба long polling опроса идут параллельно: ожидание обновлений одного бота
+        # не задерживает получение команд другого
+        pollers = [
+            threading.Thread(target=self._poll_channel, name="poll-channel", daemon=True),
+            threading.Thread(target=self._poll_group, name="poll-group", daemon=True),
+        ]
+        for poller in pollers:
+            poller.start()
+
+        try:
+            # Ожидание с таймаутом, чтобы Ctrl+C обрабатывался и на Windows
+            while not self._stop.wait(1):
+                pass
+        except KeyboardInterrupt:
+            self._stop.set()
+
+        logger.info("Monitoring stopped by user.")
+        # Сначала останавливаем опрос: после остановки поллеры не передают сообщения рабочим потокам
+        for poller in pollers:
+            poller.join(timeout=LONG_POLL_TIMEOUT + 10)
+            if poller.is_alive():
+                logger.warning(f"⚠️ Поток {poller.name} не завершился, его сообщения придут повторно")
+        self.send_status_message("🛑 Monitor service stopped.")
+        self.cleanup()
+
+        if self._restart_requested:
+            # atexit при os.execv не выполняется: дописываем лог вручную
+            atexit.unregister(_log_listener.stop)
+            _log_listener.stop()
+            # Replace the current process with a new one
+            os.execv(sys.executable, ['python'] + sys.argv)
 
 def main():
     """Запуск монитора."""
-    monitor = ChannelMonitor()
-    monitor.run()
+    with ChannelMonitor() as monitor:
+        monitor.run()
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,11 @@
 Проверка скачанных аватарок Twitter
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from PIL import Image
 import requests
@@ -11,42 +15,48 @@ import requests
 def check_avatar_file(file_path):
     """Проверяет содержимое файла аватарки"""
     try:
-        with Image.open(file_path) as img:
+        # Файл открывается один раз: сначала заголовок, затем PIL только для растровых форматов
+        with open(file_path, 'rb') as f:
+            header = f.read(20)
             print(f"\n=== {file_path.name} ===")
             print(f"Размер файла: {file_path.stat().st_size} байт")
-            print(f"Размер изображения: {img.size}")
-            print(f"Формат: {img.format}")
-            print(f"Режим: {img.mode}")
+            print(f"Заголовок файла: {header[:10].hex()}")
             
-            # Проверяем первые несколько байт файла
-            with open(file_path, 'rb') as f:
-                header = f.read(20)
-                print(f"Заголовок файла: {header[:10].hex()}")
+            # SVG и HTML не открываем через PIL - он на них только падает
+            if header.startswith(b'<svg') or header.startswith(b'<?xml'):
+                print("⚠️ Это SVG файл")
+                return True
+            if header.startswith(b'<!DOCTYPE') or header.startswith(b'<html'):
+                print("❌ Это HTML файл (ошибка)")
+                return False
+            
+            f.seek(0)
+            with Image.open(f) as img:
+                print(f"Размер изображения: {img.size}")
+                print(f"Формат: {img.format}")
+                print(f"Режим: {img.mode}")
+            
+            # Проверяем, является ли это PNG
+            if header.startswith(b'\x89PNG'):
+                print("✅ Это PNG файл")
+            else:
+                print(f"❓ Неизвестный формат: {header[:10]}")
                 
-                # Проверяем, является ли это PNG
-                if header.startswith(b'\x89PNG'):
-                    print("✅ Это PNG файл")
-                elif header.startswith(b'<svg') or header.startswith(b'<?xml'):
-                    print("⚠️ Это SVG файл")
-                elif header.startswith(b'<!DOCTYPE') or header.startswith(b'<html'):
-                    print("❌ Это HTML файл (ошибка)")
-                else:
-                    print(f"❓ Неизвестный формат: {header[:10]}")
-                    
             return True
             
     except Exception as e:
         print(f"❌ Ошибка при анализе {file_path}: {e}")
         return False
 
-def check_url_content(url):
+def check_url_content(url, session=None):
     """Проверяет содержимое URL"""
     try:
-        response = requests.head(url, timeout=5)
-        print(f"URL: {url}")
-        print(f"Статус: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type', 'неизвестно')}")
-        print(f"Content-Length: {response.headers.get('content-length', 'неизвестно')}")
+        response = (session or requests).head(url, timeout=5)
+        # Печатаем одним вызовом, чтобы вывод параллельных проверок не перемешивался
+        print(f"URL: {url}\n"
+              f"Статус: {response.status_code}\n"
+              f"Content-Type: {response.headers.get('content-type', 'неизвестно')}\n"
+              f"Content-Length: {response.headers.get('content-length', 'неизвестно')}\n")
         return True
     except Exception as e:
         print(f"❌ Ошибка проверки URL {url}: {e}")
@@ -65,8 +75,12 @@ def main():
     
     print(f"Найдено {len(avatar_files)} файлов аватарок:")
     
-    for avatar_file in avatar_files:
-        check_avatar_file(avatar_file)
+    # Отчет по локальным файлам собирается в памяти и выводится одной записью
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        for avatar_file in avatar_files:
+            check_avatar_file(avatar_file)
+    sys.stdout.write(buf.getvalue())
     
     # Проверим некоторые URL из логов
     print("\n" + "=" * 50)
@@ -78,9 +92,9 @@ def main():
         "https://api.dicebear.com/7.x/avataaars/png?seed=elonmusk"
     ]
     
-    for url in test_urls:
-        check_url_content(url)
-        print()
+    # Проверки независимы и упираются в сеть - выполняем их параллельно
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=min(16, len(test_urls))) as pool:
+        list(pool.map(lambda url: check_url_content(url, session), test_urls))
 
 if __name__ == "__main__":
     main()
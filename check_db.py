@@ -1,17 +1,4 @@
 #!/usr/bin/env python3
-import sqlite3
+from scripts.db_inspect import main
 
-conn = sqlite3.connect('data/user_news.db')
-cursor = conn.cursor()
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-tables = cursor.fetchall()
-print("Tables:", tables)
-
-if tables:
-    for table in tables:
-        table_name = table[0]
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
-        print(f"Table {table_name}: {count} records")
-
-conn.close()
\ No newline at end of file
+main(['tables'])
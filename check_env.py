@@ -3,8 +3,15 @@
 Проверка переменных окружения без импорта SDK
 """
 
+import io
 import os
+import re
 import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Строка .env вида KEY=value (комментарии и пустые строки не совпадают)
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
 
 def check_environment():
     """Проверка переменных окружения"""
@@ -27,70 +34,58 @@ def check_environment():
         print(f"  Длина GEMINI_API_KEY: {len(gemini_key)} символов")
         print(f"  Начинается с: {gemini_key[:20]}..." if len(gemini_key) > 20 else f"  Полностью: {gemini_key}")
 
-    # Проверяем .env файл
-    env_file = 'config/.env'
-    if os.path.exists(env_file):
-        print(f"\n📄 АНАЛИЗ .env ФАЙЛА: {env_file}")
-        try:
-            with open(env_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            lines = content.split('\n')
-            found_keys = {}
-
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    if key in ['GOOGLE_API_KEY', 'GEMINI_API_KEY']:
-                        found_keys[key] = {
-                            'line': i,
-                            'length': len(value),
-                            'preview': value[:20] + '...' if len(value) > 20 else value,
-                            'empty': len(value) == 0
-                        }
-
-            if found_keys:
-                for key, info in found_keys.items():
-                    status = '❌ ПУСТОЙ' if info['empty'] else f"✅ {info['length']} символов"
-                    print(f"  Строка {info['line']}: {key} = {status}")
-                    print(f"    Значение: {info['preview']}")
-            else:
-                print("  ❌ Ключи API не найдены в .env файле")
-
-        except Exception as e:
-            print(f"  ❌ Ошибка чтения .env файла: {e}")
+    # Проверяем .env файл: одно открытие, отсутствие файла - через FileNotFoundError
+    env_file = Path('config/.env')
+    try:
+        content = env_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        print(f"\n❌ Файл .env не найден: {env_file.as_posix()}")
+    except Exception as e:
+        print(f"\n📄 АНАЛИЗ .env ФАЙЛА: {env_file.as_posix()}")
+        print(f"  ❌ Ошибка чтения .env файла: {e}")
     else:
-        print(f"\n❌ Файл .env не найден: {env_file}")
+        print(f"\n📄 АНАЛИЗ .env ФАЙЛА: {env_file.as_posix()}")
+
+        found = False
+
+        # Результат печатается сразу при разборе
+        for match in _ENV_RE.finditer(content):
+            key, value = match.group(1), match.group(2)
+
+            if key in ('GOOGLE_API_KEY', 'GEMINI_API_KEY'):
+                found = True
+                line_no = content.count('\n', 0, match.start()) + 1
+                status = f"✅ {len(value)} символов" if value else '❌ ПУСТОЙ'
+                preview = value[:20] + '...' if len(value) > 20 else value
+                print(f"  Строка {line_no}: {key} = {status}")
+                print(f"    Значение: {preview}")
+
+        if not found:
+            print("  ❌ Ключи API не найдены в .env файле")
 
     # Проверяем версию Python
     print(f"\n🐍 ВЕРСИЯ PYTHON: {sys.version}")
 
     # Проверяем наличие SDK файлов
-    print("
-🔧 ПРОВЕРКА SDK:"    try:
+    print("\n🔧 ПРОВЕРКА SDK:")
+    try:
         import google
         print("  ✅ google package найден")
     except ImportError:
         print("  ❌ google package НЕ найден")
 
-    # Проверяем установленные пакеты
+    # Проверяем установленные пакеты (метаданные dist-info, без запуска pip)
     try:
-        import subprocess
-        result = subprocess.run([sys.executable, '-m', 'pip', 'list'], capture_output=True, text=True, timeout=10)
-        packages = result.stdout.lower()
+        from importlib.metadata import distributions
+        installed = {(dist.metadata['Name'] or '').lower().replace('_', '-') for dist in distributions()}
 
         sdk_found = {
-            'google-genai': 'google-genai' in packages,
-            'google-generativeai': 'google-generativeai' in packages,
-            'google-auth': 'google-auth' in packages
+            package: package in installed
+            for package in ('google-genai', 'google-generativeai', 'google-auth')
         }
 
-        print("
-📦 УСТАНОВЛЕННЫЕ ПАКЕТЫ:"        for package, found in sdk_found.items():
+        print("\n📦 УСТАНОВЛЕННЫЕ ПАКЕТЫ:")
+        for package, found in sdk_found.items():
             print(f"  {package}: {'✅' if found else '❌'}")
 
     except Exception as e:
@@ -100,6 +95,17 @@ def check_environment():
 
 def main():
     """Главная функция"""
+    # Весь отчет собирается в памяти и выводится одной записью, а не write() на каждую строку
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            _report()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+def _report():
+    """Печатает отчет о проверке системы"""
     print("🚀 ЗАПУСК ПРОВЕРКИ СИСТЕМЫ")
     print("=" * 50)
 
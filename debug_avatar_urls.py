@@ -4,135 +4,154 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def test_syndication_api(username):
+def _sniff_header(response):
+    """Первые 20 байт тела ответа (остальное не скачивается)"""
+    return response.raw.read(20, decode_content=True) or b''
+
+def test_syndication_api(session, username):
     """Тестирует Twitter Syndication API"""
-    print(f"\n=== Тест Syndication API для @{username} ===")
+    # Вывод копится и печатается целиком: проверки идут параллельно
+    out = [f"\n=== Тест Syndication API для @{username} ==="]
     
     url = f"https://cdn.syndication.twimg.com/timeline/profile?screen_name={username}"
-    print(f"URL: {url}")
+    out.append(f"URL: {url}")
     
     try:
-        response = requests.get(url, timeout=10)
-        print(f"Статус: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Размер ответа: {len(response.content)} байт")
+        response = session.get(url, timeout=10)
+        out.append(f"Статус: {response.status_code}")
+        out.append(f"Content-Type: {response.headers.get('content-type')}")
+        out.append(f"Размер ответа: {len(response.content)} байт")
         
         if response.status_code == 200:
             try:
                 data = response.json()
-                print("JSON структура:")
-                print(json.dumps(data, indent=2, ensure_ascii=False)[:500] + "...")
+                out.append("JSON структура:")
+                out.append(json.dumps(data, indent=2, ensure_ascii=False)[:500] + "...")
                 
                 if 'user' in data and 'profile_image_url' in data['user']:
                     avatar_url = data['user']['profile_image_url']
-                    print(f"\nНайден URL аватарки: {avatar_url}")
+                    out.append(f"\nНайден URL аватарки: {avatar_url}")
                     
                     # Проверяем сам URL аватарки
-                    avatar_response = requests.head(avatar_url, timeout=5)
-                    print(f"Статус аватарки: {avatar_response.status_code}")
-                    print(f"Content-Type аватарки: {avatar_response.headers.get('content-type')}")
-                    print(f"Размер аватарки: {avatar_response.headers.get('content-length', 'неизвестно')} байт")
+                    avatar_response = session.head(avatar_url, timeout=5)
+                    out.append(f"Статус аватарки: {avatar_response.status_code}")
+                    out.append(f"Content-Type аватарки: {avatar_response.headers.get('content-type')}")
+                    out.append(f"Размер аватарки: {avatar_response.headers.get('content-length', 'неизвестно')} байт")
                     
                     return avatar_url
                 else:
-                    print("❌ URL аватарки не найден в ответе")
+                    out.append("❌ URL аватарки не найден в ответе")
                     return None
             except json.JSONDecodeError:
-                print("❌ Ответ не является JSON")
-                print(f"Содержимое: {response.text[:200]}...")
+                out.append("❌ Ответ не является JSON")
+                out.append(f"Содержимое: {response.text[:200]}...")
                 return None
         else:
-            print(f"❌ Ошибка HTTP: {response.status_code}")
+            out.append(f"❌ Ошибка HTTP: {response.status_code}")
             return None
             
     except Exception as e:
-        print(f"❌ Ошибка запроса: {e}")
+        out.append(f"❌ Ошибка запроса: {e}")
         return None
+    finally:
+        print("\n".join(out))
 
-def test_unavatar(username):
+def test_unavatar(session, username):
     """Тестирует Unavatar сервис"""
-    print(f"\n=== Тест Unavatar для @{username} ===")
+    out = [f"\n=== Тест Unavatar для @{username} ==="]
     
     url = f"https://unavatar.io/twitter/{username}"
-    print(f"URL: {url}")
+    out.append(f"URL: {url}")
     
     try:
-        response = requests.get(url, allow_redirects=True, timeout=10)
-        print(f"Финальный URL: {response.url}")
-        print(f"Статус: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Размер: {len(response.content)} байт")
-        
-        # Проверяем первые байты
-        if response.content:
-            header = response.content[:20]
-            print(f"Заголовок: {header[:10].hex()}")
+        # stream=True: для проверки формата хватает первых байт, картинку целиком не качаем
+        with session.get(url, allow_redirects=True, timeout=10, stream=True) as response:
+            out.append(f"Финальный URL: {response.url}")
+            out.append(f"Статус: {response.status_code}")
+            out.append(f"Content-Type: {response.headers.get('content-type')}")
+            out.append(f"Размер: {response.headers.get('content-length', 'неизвестно')} байт")
             
-            if header.startswith(b'\x89PNG'):
-                print("✅ Это PNG изображение")
-            elif header.startswith(b'<svg'):
-                print("⚠️ Это SVG изображение")
-            elif header.startswith(b'<html') or header.startswith(b'<!DOCTYPE'):
-                print("❌ Это HTML страница (ошибка)")
-            else:
-                print(f"❓ Неизвестный формат: {header[:10]}")
-        
-        return response.url if response.status_code == 200 else None
+            # Проверяем первые байты
+            header = _sniff_header(response)
+            if header:
+                out.append(f"Заголовок: {header[:10].hex()}")
+                
+                if header.startswith(b'\x89PNG'):
+                    out.append("✅ Это PNG изображение")
+                elif header.startswith(b'<svg'):
+                    out.append("⚠️ Это SVG изображение")
+                elif header.startswith(b'<html') or header.startswith(b'<!DOCTYPE'):
+                    out.append("❌ Это HTML страница (ошибка)")
+                else:
+                    out.append(f"❓ Неизвестный формат: {header[:10]}")
+            
+            return response.url if response.status_code == 200 else None
         
     except Exception as e:
-        print(f"❌ Ошибка: {e}")
+        out.append(f"❌ Ошибка: {e}")
         return None
+    finally:
+        print("\n".join(out))
 
-def test_dicebear(username):
+def test_dicebear(session, username):
     """Тестирует DiceBear генератор"""
-    print(f"\n=== Тест DiceBear для @{username} ===")
+    out = [f"\n=== Тест DiceBear для @{username} ==="]
     
     url = f"https://api.dicebear.com/7.x/avataaars/png?seed={username}"
-    print(f"URL: {url}")
+    out.append(f"URL: {url}")
     
     try:
-        response = requests.get(url, timeout=10)
-        print(f"Статус: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Размер: {len(response.content)} байт")
-        
-        # Проверяем первые байты
-        if response.content:
-            header = response.content[:20]
-            print(f"Заголовок: {header[:10].hex()}")
+        with session.get(url, timeout=10, stream=True) as response:
+            out.append(f"Статус: {response.status_code}")
+            out.append(f"Content-Type: {response.headers.get('content-type')}")
+            out.append(f"Размер: {response.headers.get('content-length', 'неизвестно')} байт")
             
-            if header.startswith(b'\x89PNG'):
-                print("✅ Это PNG изображение (сгенерированное)")
-            else:
-                print(f"❓ Неизвестный формат: {header[:10]}")
-        
-        return url if response.status_code == 200 else None
+            # Проверяем первые байты
+            header = _sniff_header(response)
+            if header:
+                out.append(f"Заголовок: {header[:10].hex()}")
+                
+                if header.startswith(b'\x89PNG'):
+                    out.append("✅ Это PNG изображение (сгенерированное)")
+                else:
+                    out.append(f"❓ Неизвестный формат: {header[:10]}")
+            
+            return url if response.status_code == 200 else None
         
     except Exception as e:
-        print(f"❌ Ошибка: {e}")
+        out.append(f"❌ Ошибка: {e}")
         return None
+    finally:
+        print("\n".join(out))
 
 def main():
     print("Отладка URL аватарок Twitter")
     print("=" * 60)
     
     test_usernames = ["elonmusk", "jack"]
+    tests = [
+        ("Syndication API", test_syndication_api),
+        ("Unavatar", test_unavatar),
+        ("DiceBear", test_dicebear),
+    ]
+    
+    # Все проверки независимы: выполняем их параллельно через одну сессию с keep-alive
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    probes = [(username, name, test) for username in test_usernames for name, test in tests]
+    with session, ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda probe: probe[2](session, probe[0]), probes))
     
     for username in test_usernames:
-        print(f"\n{'='*20} ТЕСТИРУЕМ @{username} {'='*20}")
-        
-        # Тестируем разные методы
-        syndication_url = test_syndication_api(username)
-        unavatar_url = test_unavatar(username)
-        dicebear_url = test_dicebear(username)
-        
         print(f"\nРезультаты для @{username}:")
-        print(f"Syndication API: {'✅' if syndication_url else '❌'}")
-        print(f"Unavatar: {'✅' if unavatar_url else '❌'}")
-        print(f"DiceBear: {'✅' if dicebear_url else '❌'}")
+        for (probe_user, name, _), result in zip(probes, results):
+            if probe_user == username:
+                print(f"{name}: {'✅' if result else '❌'}")
 
 if __name__ == "__main__":
     main()
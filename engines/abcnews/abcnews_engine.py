@@ -15,23 +15,24 @@ from ..base.source_engine import SourceEngine
 
 logger = logging.getLogger(__name__)
 
+# Проверки URL медиа без url.lower(): регулярки сразу без учета регистра
+_TINY_IMAGE_RE = re.compile(r'1x1|spacer|pixel|blank', re.IGNORECASE)
+_IMAGE_EXT_RE = re.compile(r'\.(?:jpg|jpeg|png|gif|webp)\Z', re.IGNORECASE)
+_IMAGE_HINT_RE = re.compile(r'image|photo|img', re.IGNORECASE)
+_VIDEO_EXT_RE = re.compile(r'\.(?:mp4|webm|ogg|mov|m3u8|ts)\Z', re.IGNORECASE)
+_VIDEO_HINT_RE = re.compile(r'video|stream', re.IGNORECASE)
+
 class ABCNewsEngine(SourceEngine):
     """Движок для парсинга ABC News"""
     
+    SOURCE_NAME = "ABC News"
+    SUPPORTED_DOMAINS = ('abcnews.go.com', 'www.abcnews.go.com')
+    # Live updates без entryId - динамически обновляемые страницы
+    NON_ARTICLE_PATTERNS = (r'/live-updates/',)
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
     
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return [
-            "abcnews.go.com",
-            "www.abcnews.go.com"
-        ]
-    
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "ABC News"
-    
     def can_handle(self, url: str) -> bool:
         """Проверяет, может ли обработать URL"""
         # Проверяем домен
@@ -49,14 +50,10 @@ class ABCNewsEngine(SourceEngine):
             return True
         
         # Фильтруем типы URL без entryId, которые не подходят для обработки
-        excluded_patterns = [
-            '/live-updates/',  # Live updates без entryId - динамически обновляемые страницы
-        ]
-        
-        for pattern in excluded_patterns:
-            if pattern in url.lower():
-                logger.info(f"⏭️ ABC News: URL содержит исключенный паттерн '{pattern}' без entryId, пропускаем")
-                return False
+        match = self._NON_ARTICLE_RE.search(url)
+        if match:
+            logger.info(f"⏭️ ABC News: URL содержит исключенный паттерн '{match.group(0)}' без entryId, пропускаем")
+            return False
         
         return True
     
@@ -560,12 +557,11 @@ class ABCNewsEngine(SourceEngine):
             return False
         
         # Исключаем слишком маленькие изображения
-        if any(x in url.lower() for x in ['1x1', 'spacer', 'pixel', 'blank']):
+        if _TINY_IMAGE_RE.search(url):
             return False
         
         # Проверяем, что это изображение по расширению
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        if any(url.lower().endswith(ext) for ext in image_extensions):
+        if _IMAGE_EXT_RE.search(url):
             return True
         
         # Проверяем домены ABC News
@@ -575,7 +571,7 @@ class ABCNewsEngine(SourceEngine):
             return True
         
         # Проверяем, что URL содержит параметры изображения
-        if 'image' in url.lower() or 'photo' in url.lower() or 'img' in url.lower():
+        if _IMAGE_HINT_RE.search(url):
             return True
         
         return False
@@ -590,8 +586,7 @@ class ABCNewsEngine(SourceEngine):
             return False
         
         # Проверяем видео расширения
-        video_extensions = ['.mp4', '.webm', '.ogg', '.mov', '.m3u8', '.ts']
-        if any(url.lower().endswith(ext) for ext in video_extensions):
+        if _VIDEO_EXT_RE.search(url):
             return True
         
         # Проверяем видео платформы
@@ -601,7 +596,7 @@ class ABCNewsEngine(SourceEngine):
             return True
         
         # Проверяем, что URL содержит параметры видео
-        if 'video' in url.lower() or 'stream' in url.lower():
+        if _VIDEO_HINT_RE.search(url):
             return True
         
         return False
@@ -669,13 +664,5 @@ class ABCNewsEngine(SourceEngine):
             return True
         
         # Проверяем, что URL не содержит исключенные паттерны (только если нет entryId)
-        excluded_patterns = [
-            '/live-updates/',
-        ]
-        
-        for pattern in excluded_patterns:
-            if pattern in url.lower():
-                return False
-        
-        return True
+        return self._is_article_url(url)
 
@@ -3,11 +3,26 @@ Base class for content validation
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any, Iterable, List
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Признаки CAPTCHA/блокировки вместо контента
+BLOCKING_INDICATORS = (
+    'you are blocked', 'access blocked', 'request blocked',
+    'captcha', 'cloudflare', 'checking your browser',
+    'проверяем, человек ли вы', 'доступ заблокирован'
+)
+
+# Одна альтернация: текст просматривается за один проход вместо прохода на каждый признак
+_BLOCKING_RE = re.compile('|'.join(map(re.escape, BLOCKING_INDICATORS)))
+
+# Все маркеры проверки фактов - одна регулярка, каждое поле просматривается один раз
+_FACT_RE = re.compile(r'kash patel|fbi director|former|current|2025|2026', re.IGNORECASE)
+
 
 class ContentValidator(ABC):
     """
@@ -65,14 +80,7 @@ class ContentValidator(ABC):
             return False
         
         # Проверяем на CAPTCHA/блокировку
-        blocking_indicators = [
-            'you are blocked', 'access blocked', 'request blocked',
-            'captcha', 'cloudflare', 'checking your browser',
-            'проверяем, человек ли вы', 'доступ заблокирован'
-        ]
-        
-        title_lower = title.lower()
-        if any(indicator in title_lower for indicator in blocking_indicators):
+        if _BLOCKING_RE.search(title.casefold()):
             logger.warning(f"Обнаружена блокировка в заголовке: {title[:50]}...")
             return False
         
@@ -103,14 +111,7 @@ class ContentValidator(ABC):
             return False
         
         # Проверяем на CAPTCHA/блокировку
-        blocking_indicators = [
-            'you are blocked', 'access blocked', 'request blocked',
-            'captcha', 'cloudflare', 'checking your browser',
-            'проверяем, человек ли вы', 'доступ заблокирован'
-        ]
-        
-        description_lower = description.lower()
-        if any(indicator in description_lower for indicator in blocking_indicators):
+        if _BLOCKING_RE.search(description.casefold()):
             logger.warning(f"Обнаружена блокировка в описании: {description[:50]}...")
             return False
         
@@ -126,23 +127,23 @@ class ContentValidator(ABC):
         Returns:
             True если факты выглядят корректно
         """
-        title = content.get('title', '').lower()
-        description = content.get('description', '').lower()
+        title_hits = {m.lower() for m in _FACT_RE.findall(content.get('title', ''))}
+        description_hits = {m.lower() for m in _FACT_RE.findall(content.get('description', ''))}
+        hits = title_hits | description_hits
         
         # Проверяем на очевидно неверные факты
         fact_errors = []
         
         # Проверка на Kash Patel - он НЕ директор ФБР
-        if 'kash patel' in title or 'kash patel' in description:
-            if 'fbi director' in title or 'fbi director' in description:
-                fact_errors.append("Kash Patel не является директором ФБР")
+        if 'kash patel' in hits and 'fbi director' in hits:
+            fact_errors.append("Kash Patel не является директором ФБР")
         
         # Проверка на будущие даты (если дата в заголовке)
-        if '2025' in title and '2026' in title:
+        if '2025' in title_hits and '2026' in title_hits:
             fact_errors.append("Подозрительная дата в заголовке")
         
         # Проверка на противоречивые факты
-        if 'former' in description and 'current' in description:
+        if 'former' in description_hits and 'current' in description_hits:
             fact_errors.append("Противоречивые указания на статус")
         
         if fact_errors:
@@ -151,17 +152,21 @@ class ContentValidator(ABC):
         
         return True
     
-    def validate_media(self, images: List[str], videos: List[str]) -> bool:
+    def validate_media(self, images: Iterable[str], videos: Iterable[str]) -> bool:
         """
         Валидирует медиа файлы
         
         Args:
-            images: Список URL изображений
-            videos: Список URL видео
+            images: URL изображений (список или генератор)
+            videos: URL видео (список или генератор)
             
         Returns:
             True если медиа валидные
         """
+        # Берем не больше лимита + 1: генераторы дальше не читаются
+        images = list(islice(images or (), 11))
+        videos = list(islice(videos or (), 6))
+        
         # Проверяем, что есть хотя бы одно изображение или видео
         if not images and not videos:
             logger.warning("Нет медиа файлов")
@@ -169,11 +174,11 @@ class ContentValidator(ABC):
         
         # Проверяем количество
         if len(images) > 10:
-            logger.warning(f"Слишком много изображений: {len(images)}")
+            logger.warning("Слишком много изображений: больше 10")
             return False
         
         if len(videos) > 5:
-            logger.warning(f"Слишком много видео: {len(videos)}")
+            logger.warning("Слишком много видео: больше 5")
             return False
         
         return True
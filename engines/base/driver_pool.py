@@ -0,0 +1,127 @@
+"""
+Pool of warm headless Chrome drivers shared by engines
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Драйверы пула нужны для текста и meta-тегов: картинки и шрифты не скачиваются.
+# CSS не блокируется - без него меняется видимый текст элементов и догрузка lazy-контента
+_NO_IMAGES_PREFS = {'profile.managed_default_content_settings.images': 2}
+_BLOCKED_URLS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+# Хранилища страницы, которые очищаются при возврате драйвера в пул
+_CLEARED_STORAGE_TYPES = 'local_storage,session_storage,indexeddb,cache_storage,service_workers'
+
+
+class DriverPool:
+    """
+    Пул прогретых headless Chrome на весь процесс
+
+    Запуск Chrome занимает секунды и на одиночной статье дороже самого парсинга,
+    поэтому после использования драйвер не закрывается, а очищается и ждет следующий URL.
+    Изображения и шрифты в драйверах пула не загружаются (URL картинок остаются в DOM).
+    Драйверы с разным user agent хранятся раздельно. Если свободного нет - создается новый,
+    лишние при возврате закрываются (ожиданий нет)
+    """
+
+    def __init__(self, size: int = 2):
+        """
+        Args:
+            size: Сколько свободных драйверов каждого вида держать открытыми
+        """
+        self.size = size
+        self._idle: Dict[Optional[str], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _idle_queue(self, user_agent: Optional[str]) -> queue.LifoQueue:
+        with self._lock:
+            return self._idle.setdefault(user_agent, queue.LifoQueue())
+
+    def acquire(self, user_agent: Optional[str] = None):
+        """
+        Выдает свободный драйвер или запускает новый
+
+        Args:
+            user_agent: User agent браузера (None - по умолчанию)
+
+        Returns:
+            WebDriver; вернуть через release
+        """
+        try:
+            return self._idle_queue(user_agent).get_nowait()
+        except queue.Empty:
+            pass
+
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        if user_agent:
+            chrome_options.add_argument(f'--user-agent={user_agent}')
+        chrome_options.add_experimental_option('prefs', _NO_IMAGES_PREFS)
+        logger.info("🚀 Запуск нового Chrome для пула")
+        driver = webdriver.Chrome(options=chrome_options)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+        except Exception as e:
+            logger.debug(f"Не удалось отключить загрузку шрифтов: {e}")
+        return driver
+
+    def release(self, driver, user_agent: Optional[str] = None):
+        """
+        Очищает драйвер и возвращает его в пул (или закрывает, если пул полон или драйвер сломан)
+
+        Args:
+            driver: WebDriver, полученный из acquire
+            user_agent: Тот же user agent, что и при acquire
+        """
+        idle = self._idle_queue(user_agent)
+        try:
+            # Следующий URL не должен видеть cookies, localStorage, заголовки и страницу предыдущего
+            # delete_all_cookies чистит только текущий домен - сбрасываем cookies всего браузера
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            origin = driver.execute_script('return window.location.origin')
+            if origin and origin.startswith('http'):
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin',
+                                       {'origin': origin, 'storageTypes': _CLEARED_STORAGE_TYPES})
+            driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {'headers': {}})
+            driver.get('about:blank')
+            if idle.qsize() < self.size:
+                idle.put_nowait(driver)
+                return
+        except Exception as e:
+            logger.debug(f"Драйвер не вернулся в пул: {e}")
+        self._quit(driver)
+
+    def close(self):
+        """Закрывает все свободные драйверы"""
+        with self._lock:
+            idle_queues = list(self._idle.values())
+        for idle in idle_queues:
+            while True:
+                try:
+                    self._quit(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+# Общий пул процесса; размер задается при старте из news_parser.selenium_pool_size
+driver_pool = DriverPool()
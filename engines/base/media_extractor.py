@@ -3,17 +3,65 @@ Base class for media extraction from news sources
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+from urllib.parse import urlsplit, urlunsplit
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
 
+def _canonicalize(url: str) -> str:
+    """URL без query и fragment: трекинговые параметры не влияют на проверку и сравнение"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+def _unique(urls: Iterable[str]) -> Iterator[str]:
+    """Пропускает повторы по канонической форме, сохраняя порядок и исходные URL"""
+    seen = set()
+    for url in urls:
+        key = _canonicalize(url)
+        if key not in seen:
+            seen.add(key)
+            yield url
+
+
 class MediaExtractor(ABC):
     """
     Базовый класс для извлечения медиа файлов из новостных источников
     """
     
+    # Извлекатели живут все время работы сервиса: атрибуты в слотах, без __dict__
+    __slots__ = (
+        'config', 'max_images', 'max_videos', 'max_image_size_mb', 'max_video_size_mb',
+        'max_video_duration_seconds',
+    )
+    
+    # Fallback изображения по теме заголовка: ключевое слово -> URL. При совпадении
+    # нескольких слов побеждает объявленное раньше; если совпадений нет - FALLBACK_DEFAULT
+    FALLBACK_MAP: Dict[str, List[str]] = {}
+    FALLBACK_DEFAULT: List[str] = []
+    _FALLBACK_PRIORITY: Dict[str, int] = {}
+    _FALLBACK_MATCHER = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Поиск всех ключевых слов заголовка одной регуляркой строится один раз на класс
+        if 'FALLBACK_MAP' not in cls.__dict__:
+            return
+        cls._FALLBACK_PRIORITY = {keyword: i for i, keyword in enumerate(cls.FALLBACK_MAP)}
+        if not cls.FALLBACK_MAP:
+            cls._FALLBACK_MATCHER = None
+        else:
+            # Просмотр вперед находит и перекрывающиеся слова; длинные - первыми
+            keywords = sorted(cls.FALLBACK_MAP, key=len, reverse=True)
+            cls._FALLBACK_MATCHER = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Инициализация извлекателя медиа
@@ -29,30 +77,36 @@ class MediaExtractor(ABC):
         self.max_video_duration_seconds = config.get('max_video_duration_seconds', 300)
     
     @abstractmethod
-    def extract_images(self, url: str, content: Dict[str, Any]) -> List[str]:
+    def extract_images(self, url: str, content: Dict[str, Any]) -> Iterable[str]:
         """
         Извлекает изображения из контента
         
+        Может быть генератором: extract_media забирает только первые
+        max_images URL, и обход контента дальше не продолжается
+        
         Args:
             url: Исходный URL
             content: Парсированный контент
             
         Returns:
-            Список URL изображений
+            URL изображений
         """
         pass
     
     @abstractmethod
-    def extract_videos(self, url: str, content: Dict[str, Any]) -> List[str]:
+    def extract_videos(self, url: str, content: Dict[str, Any]) -> Iterable[str]:
         """
         Извлекает видео из контента
         
+        Может быть генератором: extract_media забирает только первые
+        max_videos URL, и обход контента дальше не продолжается
+        
         Args:
             url: Исходный URL
             content: Парсированный контент
             
         Returns:
-            Список URL видео
+            URL видео
         """
         pass
     
@@ -67,15 +121,23 @@ class MediaExtractor(ABC):
         Returns:
             Словарь с медиа файлами
         """
+        # Медиа отключены в конфигурации - разбор страницы не нужен
+        if self.max_images <= 0 and self.max_videos <= 0:
+            return {'images': [], 'videos': []}
+        
         try:
-            images = self.extract_images(url, content)
-            videos = self.extract_videos(url, content)
+            # Ограничиваем количество медиа, не дочитывая извлекатели до конца;
+            # повторы (по URL без query и fragment) не занимают место в лимите.
+            # Категория с нулевым лимитом не извлекается вовсе
+            images = []
+            if self.max_images > 0:
+                images = list(islice(_unique(self.extract_images(url, content)), self.max_images))
             
-            # Ограничиваем количество медиа
-            images = images[:self.max_images]
-            videos = videos[:self.max_videos]
+            videos = []
+            if self.max_videos > 0:
+                videos = list(islice(_unique(self.extract_videos(url, content)), self.max_videos))
             
-            logger.info(f"📸 Извлечено {len(images)} изображений, {len(videos)} видео")
+            logger.info("📸 Извлечено %d изображений, %d видео", len(images), len(videos))
             
             return {
                 'images': images,
@@ -83,7 +145,7 @@ class MediaExtractor(ABC):
             }
             
         except Exception as e:
-            logger.error(f"Ошибка извлечения медиа: {e}")
+            logger.error("Ошибка извлечения медиа: %s", e)
             return {'images': [], 'videos': []}
     
     def validate_image_url(self, url: str) -> bool:
@@ -96,12 +158,17 @@ class MediaExtractor(ABC):
         Returns:
             True если URL валидный
         """
-        if not url or not isinstance(url, str):
+        if not url:
             return False
         
+        # Проверяется путь: параметры вроде ?logo=true не отбрасывают настоящее изображение
+        try:
+            url_lower = str.lower(_canonicalize(url))
+        except (AttributeError, TypeError):
+            return False  # не строка (bytes тоже отсекаются здесь)
+        
         # Проверяем расширение файла
         valid_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-        url_lower = url.lower()
         
         if not any(ext in url_lower for ext in valid_extensions):
             return False
@@ -123,12 +190,16 @@ class MediaExtractor(ABC):
         Returns:
             True если URL валидный
         """
-        if not url or not isinstance(url, str):
+        if not url:
             return False
         
+        try:
+            url_lower = str.lower(_canonicalize(url))
+        except (AttributeError, TypeError):
+            return False  # не строка (bytes тоже отсекаются здесь)
+        
         # Проверяем расширение файла
         valid_extensions = ['.mp4', '.webm', '.avi', '.mov']
-        url_lower = url.lower()
         
         if not any(ext in url_lower for ext in valid_extensions):
             return False
@@ -145,5 +216,10 @@ class MediaExtractor(ABC):
         Returns:
             Список fallback URL изображений
         """
-        # Базовая реализация - можно переопределить в наследниках
-        return []
+        if self._FALLBACK_MATCHER is None:
+            return list(self.FALLBACK_DEFAULT)
+        
+        title_lower = (title or '').lower()
+        matched = (m.group(1) for m in self._FALLBACK_MATCHER.finditer(title_lower))
+        best = min(matched, key=self._FALLBACK_PRIORITY.__getitem__, default=None)
+        return list(self.FALLBACK_MAP[best] if best is not None else self.FALLBACK_DEFAULT)
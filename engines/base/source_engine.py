@@ -3,8 +3,45 @@ Base interface for news source engines
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, List, Tuple, Type
 from datetime import datetime
+from urllib.parse import urlsplit
+
+
+class _DomainTrie:
+    """
+    Дерево доменов по меткам справа налево (com -> politico -> www)
+    
+    Поиск движка по хосту - O(число меток хоста), независимо от числа движков.
+    Общие суффиксы (com, eu) хранятся один раз.
+    """
+    
+    _ENGINE = None  # ключ движка в узле; метки домена - всегда строки
+    
+    def __init__(self):
+        self._root: Dict[Any, Any] = {}
+    
+    def insert(self, domain: str, engine_class: Type['SourceEngine']):
+        """Связывает домен и все его поддомены с классом движка"""
+        node = self._root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        node[self._ENGINE] = engine_class
+    
+    def match(self, host: str) -> Optional[Type['SourceEngine']]:
+        """Возвращает движок самого длинного совпавшего домена или None"""
+        node = self._root
+        engine_class = None
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            engine_class = node.get(self._ENGINE, engine_class)
+        return engine_class
+
+
+_domain_trie = _DomainTrie()
 
 
 class SourceEngine(ABC):
@@ -12,8 +49,35 @@ class SourceEngine(ABC):
     Базовый интерфейс для движков новостных источников
     
     Каждый источник (Politico, AP News, CNN, etc.) должен реализовать этот интерфейс
+    и объявить SOURCE_NAME и SUPPORTED_DOMAINS
     """
     
+    # Название источника (например, 'POLITICO') и поддерживаемые домены
+    SOURCE_NAME: str = ''
+    SUPPORTED_DOMAINS: Tuple[str, ...] = ()
+    
+    # Регулярки URL статей и не-статей (live-ленты, разделы); компилируются один раз при объявлении класса
+    ARTICLE_URL_PATTERNS: Tuple[str, ...] = ()
+    NON_ARTICLE_PATTERNS: Tuple[str, ...] = ()
+    _ARTICLE_RE: Optional[re.Pattern] = None
+    _NON_ARTICLE_RE: Optional[re.Pattern] = None
+    
+    # Базовые атрибуты в слотах; наследники со своими атрибутами получают __dict__ как обычно
+    __slots__ = ('config', 'source_name', 'supported_domains')
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Домены регистрируются при объявлении класса, до создания экземпляров
+        # (схемы вроде tg://post - не домены)
+        for domain in cls.__dict__.get('SUPPORTED_DOMAINS', ()):
+            if '/' not in domain:
+                _domain_trie.insert(domain, cls)
+        
+        if 'ARTICLE_URL_PATTERNS' in cls.__dict__:
+            cls._ARTICLE_RE = re.compile('|'.join(cls.ARTICLE_URL_PATTERNS), re.IGNORECASE) if cls.ARTICLE_URL_PATTERNS else None
+        if 'NON_ARTICLE_PATTERNS' in cls.__dict__:
+            cls._NON_ARTICLE_RE = re.compile('|'.join(cls.NON_ARTICLE_PATTERNS), re.IGNORECASE) if cls.NON_ARTICLE_PATTERNS else None
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Инициализация движка
@@ -22,31 +86,64 @@ class SourceEngine(ABC):
             config: Конфигурация движка из config.yaml
         """
         self.config = config
-        self.source_name = self._get_source_name()
-        self.supported_domains = self._get_supported_domains()
+        self.source_name = self.SOURCE_NAME
+        self.supported_domains = self.SUPPORTED_DOMAINS
+    
+    @staticmethod
+    def route(url: str) -> Optional[Type['SourceEngine']]:
+        """
+        Находит класс движка по хосту URL среди объявленных движков
+        
+        Args:
+            url: URL для проверки
+            
+        Returns:
+            Класс движка или None
+        """
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return None
+        return _domain_trie.match(host) if host else None
     
-    @abstractmethod
     def _get_source_name(self) -> str:
         """Возвращает название источника (например, 'POLITICO')"""
-        pass
+        return self.SOURCE_NAME
     
-    @abstractmethod
-    def _get_supported_domains(self) -> List[str]:
+    def _get_supported_domains(self) -> Tuple[str, ...]:
         """Возвращает список поддерживаемых доменов"""
-        pass
+        return self.SUPPORTED_DOMAINS
     
-    @abstractmethod
     def can_handle(self, url: str) -> bool:
         """
         Проверяет, может ли движок обработать данный URL
         
+        По умолчанию - хост URL совпадает с одним из supported_domains
+        или является его поддоменом, и URL похож на статью (_is_article_url)
+        
         Args:
             url: URL для проверки
             
         Returns:
             True если движок может обработать URL
         """
-        pass
+        return type(self) is SourceEngine.route(url) and self._is_article_url(url)
+    
+    def _is_article_url(self, url: str) -> bool:
+        """
+        Проверяет URL по ARTICLE_URL_PATTERNS и NON_ARTICLE_PATTERNS движка
+        
+        Args:
+            url: URL для проверки
+            
+        Returns:
+            False если URL совпал с не-статьей или не совпал ни с одним паттерном статьи
+        """
+        if self._NON_ARTICLE_RE is not None and self._NON_ARTICLE_RE.search(url):
+            return False
+        if self._ARTICLE_RE is not None and not self._ARTICLE_RE.search(url):
+            return False
+        return True
     
     @abstractmethod
     def parse_url(self, url: str) -> Dict[str, Any]:
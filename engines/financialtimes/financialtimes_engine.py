@@ -2,41 +2,177 @@
 Financial Times news source engine
 """
 
-from typing import Dict, Any, List
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterator, List, Optional
+import json
 import logging
+import re
+import threading
 import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from ..base import SourceEngine, MediaExtractor, ContentValidator
+from ..base.driver_pool import driver_pool
+
+# Быстрый разбор HTML на C (опционально), иначе - BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Быстрый разбор JSON-LD (опционально)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# URL статьи -> (время истечения, URL копии или None); общий для всех экземпляров движка
+_archive_cache = OrderedDict()
+_archive_cache_lock = threading.Lock()
+# Результат поиска, когда ни один archive-домен не ответил: это не "копии нет", в кэш не попадает
+_ARCHIVE_UNAVAILABLE = object()
+
+# Зеркала archive.today, на которых ищется копия статьи
+ARCHIVE_DOMAINS = ('archive.ph', 'archive.today', 'archive.is')
+# Кэш поиска в архиве: копии нет - повторно не спрашиваем час, копия найдена - сутки
+ARCHIVE_MISS_TTL = 3600
+ARCHIVE_HIT_TTL = 24 * 3600
+ARCHIVE_CACHE_SIZE = 4096
+
+# Селекторы метаданных статьи в порядке приоритета: (селектор, атрибут со значением);
+# атрибут None - берется видимый текст элемента
+METADATA_SELECTORS = {
+    'title': [
+        ('h1[class*="Headline"]', None),
+        ('h1[data-trackable="heading"]', None),
+        ('h1.article__headline', None),
+        ('h1.topper__headline', None),
+        ('h1', None),
+        ('meta[property="og:title"]', 'content'),
+    ],
+    'description': [
+        ('p[class*="Standfirst"]', None),
+        ('p[data-trackable="standfirst"]', None),
+        ('div.article__standfirst p', None),
+        ('div.topper__standfirst p', None),
+        ('meta[property="og:description"]', 'content'),
+        ('meta[name="description"]', 'content'),
+    ],
+    'published': [
+        ('time[datetime]', 'datetime'),
+        ('meta[property="article:published_time"]', 'content'),
+        ('meta[name="date"]', 'content'),
+    ],
+    'og_image': [('meta[property="og:image"]', 'content')],
+    'twitter_image': [('meta[name="twitter:image"]', 'content')],
+}
+
+# Для каждого поля - [селектор, значение] первого непустого совпадения или null
+METADATA_JS = """
+const fields = arguments[0], result = {};
+for (const [field, selectors] of Object.entries(fields)) {
+    result[field] = null;
+    for (const [selector, attr] of selectors) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        const value = attr ? el.getAttribute(attr) : el.innerText;
+        if (value && value.trim()) {
+            result[field] = [selector, value.trim()];
+            break;
+        }
+    }
+}
+return result;
+"""
+
+# Тексты всех блоков JSON-LD страницы
+JSON_LD_JS = "return Array.from(document.querySelectorAll('script[type=\"application/ld+json\"]'), s => s.textContent);"
+
+# Заголовок снимка archive.is: (селектор, атрибут со значением или None для текста)
+ARCHIVE_TITLE_SELECTORS = (('h1', None), ('meta[property="og:title"]', 'content'))
+
+# Снимок archive.is без браузера: меньше стольких символов текста - открываем в Selenium,
+# маркеры - страница капчи вместо снимка
+ARCHIVE_MIN_CONTENT_LENGTH = 500
+ARCHIVE_CAPTCHA_MARKERS = ('g-recaptcha', 'h-captcha', 'security check to access')
+_ARCHIVE_CAPTCHA_RE = re.compile('|'.join(map(re.escape, ARCHIVE_CAPTCHA_MARKERS)))
+
+# Служебные абзацы снимка и признаки иконок среди изображений:
+# каждый список проверяется одним проходом регулярного выражения
+SKIP_PARAGRAPH_MARKERS = ('Please use the sharing tools', 'Copyright Policy', 'gift article service')
+_SKIP_PARAGRAPH_RE = re.compile('|'.join(map(re.escape, SKIP_PARAGRAPH_MARKERS)))
+SKIP_IMAGE_KEYWORDS = ('icon', 'logo', 'avatar', 'placeholder')
+_SKIP_IMAGE_RE = re.compile('|'.join(SKIP_IMAGE_KEYWORDS), re.IGNORECASE)
+# Навигационные абзацы ("Read more", "Related")
+NAVIGATION_PREFIXES = ('Read', 'Related')
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Статья отрисована, когда есть заголовок или тело; страница догружена - документ и все изображения
+ARTICLE_READY_SELECTOR = 'h1, article, div[class*="ArticleBody"]'
+PAGE_SETTLED_JS = "return document.readyState === 'complete' && Array.from(document.images).every(img => img.complete);"
+
+# Googlebot user agent для обхода paywall FT
+GOOGLEBOT_USER_AGENT = 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'
+
+
+def _loads_json(text: str):
+    """Разбор JSON (через orjson, если он установлен); ошибки - json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_html(html: str):
+    """Разбирает HTML страницы: дерево selectolax (Lexbor) или BeautifulSoup"""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    from bs4 import BeautifulSoup
+    # lxml токенизирует на C - на больших страницах FT во много раз быстрее html.parser
+    return BeautifulSoup(html, 'lxml')
+
+
+def _css(node, selector: str) -> list:
+    """Все элементы по CSS-селектору"""
+    return node.css(selector) if LexborHTMLParser is not None else node.select(selector)
+
+
+def _css_first(node, selector: str):
+    """Первый элемент по CSS-селектору или None"""
+    return node.css_first(selector) if LexborHTMLParser is not None else node.select_one(selector)
+
+
+def _text(node) -> str:
+    """Текст элемента со всеми вложенными"""
+    return (node.text() if LexborHTMLParser is not None else node.get_text()) or ''
+
+
+def _attr(node, name: str) -> str:
+    """Значение атрибута элемента ('' если его нет)"""
+    return (node.attributes.get(name) if LexborHTMLParser is not None else node.get(name)) or ''
+
 
 class FinancialTimesMediaExtractor(MediaExtractor):
     """Извлекатель медиа для Financial Times"""
     
-    def extract_images(self, url: str, content: Dict[str, Any]) -> List[str]:
+    __slots__ = ()
+    
+    def extract_images(self, url: str, content: Dict[str, Any]) -> Iterator[str]:
         """Извлекает изображения из контента Financial Times"""
-        images = []
-        
-        if 'images' in content:
-            for img_url in content['images']:
-                if self.validate_image_url(img_url):
-                    images.append(img_url)
-        
-        return images
+        for img_url in content.get('images') or ():
+            if self.validate_image_url(img_url):
+                yield img_url
     
-    def extract_videos(self, url: str, content: Dict[str, Any]) -> List[str]:
+    def extract_videos(self, url: str, content: Dict[str, Any]) -> Iterator[str]:
         """Извлекает видео из контента Financial Times"""
-        videos = []
-        
-        if 'videos' in content:
-            for vid_url in content['videos']:
-                if self.validate_video_url(vid_url):
-                    videos.append(vid_url)
-        
-        return videos
+        for vid_url in content.get('videos') or ():
+            if self.validate_video_url(vid_url):
+                yield vid_url
 
 
 class FinancialTimesContentValidator(ContentValidator):
@@ -58,24 +194,17 @@ class FinancialTimesEngine(SourceEngine):
     Движок для обработки новостей Financial Times
     """
     
+    SOURCE_NAME = "Financial Times"
+    SUPPORTED_DOMAINS = ('ft.com', 'www.ft.com')
+    
     def __init__(self, config: Dict[str, Any]):
         """Инициализация движка Financial Times"""
         super().__init__(config)
+        # Chrome не запускается на каждый URL: драйверы берутся из общего пула
+        # (его размер задается один раз при старте, EngineRegistry.configure)
         self.media_extractor = FinancialTimesMediaExtractor(config)
         self.content_validator = FinancialTimesContentValidator(config)
     
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "Financial Times"
-    
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return ['ft.com', 'www.ft.com']
-    
-    def can_handle(self, url: str) -> bool:
-        """Проверяет, может ли обработать URL"""
-        return any(domain in url.lower() for domain in self.supported_domains)
-    
     def parse_url(self, url: str, driver=None) -> Dict[str, Any]:
         """
         Парсит URL новости Financial Times
@@ -138,182 +267,248 @@ class FinancialTimesEngine(SourceEngine):
             logger.error(f"❌ Ошибка парсинга Financial Times URL: {e}", exc_info=True)
             return {}
     
-    def _try_archive_is(self, url: str, driver=None) -> Dict[str, Any]:
+    def _find_archive_url(self, url: str) -> Optional[str]:
         """
-        Пробует получить контент через Archive.is для обхода paywall
+        Ищет копию статьи в архиве с учетом кэша прошлых поисков
+        
+        Args:
+            url: URL статьи
+            
+        Returns:
+            URL архивной копии или None
+        """
+        with _archive_cache_lock:
+            entry = _archive_cache.get(url)
+            if entry is not None:
+                expires_at, archive_url = entry
+                if expires_at >= time.monotonic():
+                    _archive_cache.move_to_end(url)
+                    logger.info(f"📦 Archive: результат из кэша ({'копия найдена' if archive_url else 'копии нет'})")
+                    return archive_url
+                del _archive_cache[url]
+        
+        archive_url = self._query_archive_mirrors(url)
+        if archive_url is _ARCHIVE_UNAVAILABLE:
+            logger.warning("⚠️ Archive: все домены ответили ошибкой, результат не кэшируется")
+            return None
+        
+        with _archive_cache_lock:
+            ttl = ARCHIVE_HIT_TTL if archive_url else ARCHIVE_MISS_TTL
+            _archive_cache[url] = (time.monotonic() + ttl, archive_url)
+            _archive_cache.move_to_end(url)
+            while len(_archive_cache) > ARCHIVE_CACHE_SIZE:
+                _archive_cache.popitem(last=False)
+        return archive_url
+    
+    def _query_archive_mirrors(self, url: str) -> Any:
+        """
+        Ищет копию статьи сразу на всех archive-доменах (archive.is часто блокируется)
+        
+        Запросы идут параллельно, берется первый ответ 200: ожидание - самый медленный
+        нужный домен, а не сумма таймаутов всех
+        
+        Args:
+            url: URL статьи
+            
+        Returns:
+            URL архивной копии, None (копии нет) или _ARCHIVE_UNAVAILABLE (все домены с ошибкой)
         """
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.chrome.options import Options
-        import time
         import requests
         
-        driver_created = False
+        def probe(domain: str) -> Optional[str]:
+            logger.info(f"📦 Пробуем {domain}...")
+            response = requests.get(f"https://{domain}/newest/{url}", timeout=10, allow_redirects=True)
+            response.close()
+            if response.status_code == 429 or response.status_code >= 500:
+                # Ограничение или сбой домена - ошибка, а не отсутствие копии
+                raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+            return response.url if response.status_code == 200 else None
         
+        executor = ThreadPoolExecutor(max_workers=len(ARCHIVE_DOMAINS))
         try:
-            # Пробуем разные домены archive (archive.is часто блокируется)
-            archive_domains = ['archive.ph', 'archive.today', 'archive.is']
-            archive_url = None
-            
-            for domain in archive_domains:
-                archive_api_url = f"https://{domain}/newest/{url}"
+            futures = {executor.submit(probe, domain): domain for domain in ARCHIVE_DOMAINS}
+            answered = False
+            for future in as_completed(futures):
+                domain = futures[future]
                 try:
-                    logger.info(f"📦 Пробуем {domain}...")
-                    response = requests.get(archive_api_url, timeout=10, allow_redirects=True)
-                    if response.status_code == 200:
-                        archive_url = response.url
-                        logger.info(f"✅ Найдена копия на {domain}: {archive_url[:80]}...")
-                        break
+                    archive_url = future.result()
                 except Exception as e:
                     logger.debug(f"⚠️ {domain} недоступен: {e}")
                     continue
+                answered = True
+                if archive_url:
+                    logger.info(f"✅ Найдена копия на {domain}: {archive_url[:80]}...")
+                    return archive_url
+            return None if answered else _ARCHIVE_UNAVAILABLE
+        finally:
+            # Остальные запросы дорабатывают в фоне, их не ждем
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _try_archive_is(self, url: str, driver=None) -> Dict[str, Any]:
+        """
+        Пробует получить контент через Archive.is для обхода paywall
+        """
+        pooled_driver = None
+        
+        try:
+            archive_url = self._find_archive_url(url)
             
             if not archive_url:
                 logger.warning("⚠️ Ни один archive-домен не доступен")
                 return {}
             
+            # Снимок archive.is уже отрисован и без paywall - сначала обычный HTTP-запрос, без браузера
+            html = self._fetch_archive_html(archive_url)
+            if html:
+                result = self._parse_archive_html(html)
+                if len(result['content']) >= ARCHIVE_MIN_CONTENT_LENGTH:
+                    logger.info("📦 Archive.is: хватило HTTP-запроса, Selenium не нужен")
+                    return result
+                logger.info("⚠️ HTTP-копия Archive.is неполная, открываем в Selenium...")
+            
             # Парсим страницу из Archive.is
             if not driver:
-                chrome_options = Options()
-                chrome_options.add_argument('--headless')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                driver = webdriver.Chrome(options=chrome_options)
-                driver_created = True
+                driver = pooled_driver = driver_pool.acquire()
             
             driver.get(archive_url)
-            time.sleep(3)
-            
-            # Извлекаем контент
-            from bs4 import BeautifulSoup
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Извлекаем заголовок
-            title = ""
-            for selector in ['h1', 'meta[property="og:title"]']:
-                try:
-                    if 'meta' in selector:
-                        elem = soup.find('meta', property='og:title')
-                        if elem:
-                            title = elem.get('content', '')
-                    else:
-                        elem = soup.find('h1')
-                        if elem:
-                            title = elem.get_text().strip()
-                    if title:
-                        break
-                except:
-                    pass
-            
-            # Извлекаем описание
-            description = ""
-            try:
-                meta_desc = soup.find('meta', property='og:description')
-                if meta_desc:
-                    description = meta_desc.get('content', '')
-            except:
-                pass
-            
-            # Извлекаем контент
-            paragraphs = []
-            
-            # Сначала пробуем JSON-LD (структурированные данные)
+            # Снимок готов, когда отрисован заголовок или тело статьи
             try:
-                json_ld_scripts = soup.find_all('script', type='application/ld+json')
-                for script in json_ld_scripts:
-                    try:
-                        import json
-                        data = json.loads(script.string)
-                        # Ищем articleBody
-                        if isinstance(data, dict) and 'articleBody' in data:
-                            article_body = data['articleBody']
-                            if article_body and len(article_body) > 500:
-                                logger.info(f"✅ Найден articleBody в JSON-LD: {len(article_body)} символов")
-                                paragraphs = [article_body]
-                                break
-                    except:
-                        pass
-            except:
-                pass
-            
-            # Если JSON-LD не дал результата, парсим HTML
-            if not paragraphs:
-                article = soup.find('article')
-                if article:
-                    ps = article.find_all('p')
-                else:
-                    ps = soup.find_all('p')
-                
-                for p in ps:
-                    text = p.get_text().strip()
-                    if text and len(text) > 30:
-                        # Пропускаем служебные тексты
-                        if any(skip in text for skip in ['Please use the sharing tools', 'Copyright Policy', 'gift article service']):
-                            continue
-                        if text not in paragraphs:
-                            paragraphs.append(text)
-            
-            content = ' '.join(paragraphs)
-            
-            # Извлекаем изображение
-            images = []
-            try:
-                og_image = soup.find('meta', property='og:image')
-                if og_image:
-                    img_url = og_image.get('content', '')
-                    if img_url:
-                        images.append(img_url)
-            except:
-                pass
-            
-            # Извлекаем дату
-            from datetime import datetime
-            published = datetime.now().isoformat()
-            
-            result = {
-                'title': title,
-                'description': description,
-                'content': content,
-                'published': published,
-                'images': images,
-                'videos': [],
-                'source': 'Financial Times'
-            }
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR))
+                )
+            except TimeoutException:
+                logger.warning("⚠️ Таймаут ожидания снимка Archive.is")
             
-            logger.info(f"📦 Archive.is парсинг: {len(content)} символов, {len(images)} изображений")
-            
-            return result
+            return self._parse_archive_html(driver.page_source)
             
         except Exception as e:
             logger.error(f"❌ Ошибка парсинга Archive.is: {e}")
             return {}
         finally:
-            if driver_created and driver:
+            if pooled_driver:
+                driver_pool.release(pooled_driver)
+    
+    def _fetch_archive_html(self, archive_url: str) -> Optional[str]:
+        """
+        Скачивает снимок Archive.is без браузера
+        
+        Returns:
+            HTML снимка или None (ошибка, не 200 или страница капчи)
+        """
+        import requests
+        
+        try:
+            response = requests.get(archive_url, headers={'User-Agent': BROWSER_USER_AGENT}, timeout=15)
+        except Exception as e:
+            logger.debug(f"⚠️ Не удалось скачать снимок Archive.is: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.debug(f"⚠️ Archive.is вернул {response.status_code}")
+            return None
+        
+        html = response.text
+        if _ARCHIVE_CAPTCHA_RE.search(html):
+            logger.info("⚠️ Archive.is показал капчу")
+            return None
+        
+        return html
+    
+    def _parse_archive_html(self, html: str) -> Dict[str, Any]:
+        """Извлекает данные статьи из HTML снимка Archive.is"""
+        tree = _parse_html(html)
+        
+        # Извлекаем заголовок
+        title = ""
+        for selector, attr in ARCHIVE_TITLE_SELECTORS:
+            try:
+                elem = _css_first(tree, selector)
+                if elem:
+                    title = _attr(elem, attr) if attr else _text(elem).strip()
+                if title:
+                    break
+            except:
+                pass
+        
+        # Извлекаем описание
+        description = ""
+        try:
+            meta_desc = _css_first(tree, 'meta[property="og:description"]')
+            if meta_desc:
+                description = _attr(meta_desc, 'content')
+        except:
+            pass
+        
+        # Извлекаем контент
+        paragraphs = []
+        
+        # Сначала пробуем JSON-LD (структурированные данные)
+        try:
+            json_ld_scripts = _css(tree, 'script[type="application/ld+json"]')
+            for script in json_ld_scripts:
                 try:
-                    driver.quit()
+                    data = _loads_json(_text(script))
+                    # Ищем articleBody
+                    if isinstance(data, dict) and 'articleBody' in data:
+                        article_body = data['articleBody']
+                        if article_body and len(article_body) > 500:
+                            logger.info(f"✅ Найден articleBody в JSON-LD: {len(article_body)} символов")
+                            paragraphs = [article_body]
+                            break
                 except:
                     pass
+        except:
+            pass
+        
+        # Если JSON-LD не дал результата, парсим HTML
+        if not paragraphs:
+            article = _css_first(tree, 'article')
+            ps = _css(article if article else tree, 'p')
+            
+            texts = (_text(p).strip() for p in ps)
+            # Пропускаем короткие и служебные тексты; dict.fromkeys убирает повторы за один проход, сохраняя порядок
+            paragraphs = list(dict.fromkeys(
+                text for text in texts if len(text) > 30 and not _SKIP_PARAGRAPH_RE.search(text)
+            ))
+        
+        content = ' '.join(paragraphs)
+        
+        # Извлекаем изображение
+        images = []
+        try:
+            og_image = _css_first(tree, 'meta[property="og:image"]')
+            if og_image:
+                img_url = _attr(og_image, 'content')
+                if img_url:
+                    images.append(img_url)
+        except:
+            pass
+        
+        # Извлекаем дату
+        published = datetime.now().isoformat()
+        
+        result = {
+            'title': title,
+            'description': description,
+            'content': content,
+            'published': published,
+            'images': images,
+            'videos': [],
+            'source': 'Financial Times'
+        }
+        
+        logger.info(f"📦 Archive.is парсинг: {len(content)} символов, {len(images)} изображений")
+        
+        return result
     
     def _parse_with_selenium(self, url: str, driver=None) -> Dict[str, Any]:
         """Парсит страницу Financial Times с помощью Selenium"""
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        
-        driver_created = False
+        pooled_driver = None
         
         try:
             if not driver:
-                chrome_options = Options()
-                chrome_options.add_argument('--headless')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
                 # Используем Googlebot user agent для обхода paywall FT
-                chrome_options.add_argument('--user-agent=Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)')
-                driver = webdriver.Chrome(options=chrome_options)
-                driver_created = True
+                driver = pooled_driver = driver_pool.acquire(GOOGLEBOT_USER_AGENT)
             
             logger.info(f"🔍 Selenium парсинг для получения заголовка...")
             
@@ -328,28 +523,39 @@ class FinancialTimesEngine(SourceEngine):
             
             driver.get(url)
             
-            # Ждем загрузки контента (FT требует больше времени)
-            time.sleep(8)
-            
-            # Прокручиваем страницу для загрузки lazy-load контента
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(2)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            # Ждем появления статьи (не дольше 10 секунд) вместо фиксированной паузы
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR))
+                )
+            except TimeoutException:
+                logger.warning("⚠️ Таймаут ожидания загрузки статьи")
+            
+            # Прокручиваем страницу для загрузки lazy-load контента;
+            # после каждой прокрутки ждем, пока догрузятся страница и изображения
+            for scroll_js in ("window.scrollTo(0, document.body.scrollHeight / 2);",
+                              "window.scrollTo(0, document.body.scrollHeight);",
+                              "window.scrollTo(0, 0);"):
+                driver.execute_script(scroll_js)
+                try:
+                    WebDriverWait(driver, 3).until(lambda d: d.execute_script(PAGE_SETTLED_JS))
+                except TimeoutException:
+                    pass
             
             html = driver.page_source
             logger.info(f"📄 HTML длина: {len(html)} символов")
             
+            # Заголовок, описание, дата и og/twitter изображения - одним запросом к браузеру
+            metadata = self._extract_metadata(driver)
+            
             # Извлекаем заголовок
-            title = self._extract_title(driver)
+            title = metadata['title']
             if not title:
                 logger.warning("⚠️ Не удалось извлечь заголовок")
                 return {}
             
             # Извлекаем описание
-            description = self._extract_description(driver)
+            description = metadata['description']
             
             # Пробуем извлечь контент из JSON-LD (часто содержит полный текст без paywall)
             content = self._extract_content_from_jsonld(driver)
@@ -361,11 +567,11 @@ class FinancialTimesEngine(SourceEngine):
             else:
                 logger.info(f"✅ JSON-LD дал {len(content)} символов контента")
             
-            # Извлекаем дату публикации
-            published = self._extract_publish_date(driver)
+            # Дата публикации (если не найдена - текущая)
+            published = metadata['published'] or datetime.now().isoformat()
             
             # Извлекаем изображения
-            images = self._extract_images(driver)
+            images = self._extract_images(driver, metadata)
             
             # Извлекаем видео
             videos = self._extract_videos(driver)
@@ -388,95 +594,54 @@ class FinancialTimesEngine(SourceEngine):
             logger.error(f"❌ Ошибка Selenium парсинга: {e}", exc_info=True)
             return {}
         finally:
-            if driver_created and driver:
-                driver.quit()
+            if pooled_driver:
+                driver_pool.release(pooled_driver, GOOGLEBOT_USER_AGENT)
     
-    def _extract_title(self, driver) -> str:
-        """Извлекает заголовок статьи"""
-        try:
-            # Пробуем разные селекторы для заголовка
-            selectors = [
-                'h1[class*="Headline"]',
-                'h1[data-trackable="heading"]',
-                'h1.article__headline',
-                'h1.topper__headline',
-                'h1',
-                'meta[property="og:title"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    if 'meta' in selector:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        title = element.get_attribute('content')
-                    else:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        title = element.text.strip()
-                    
-                    if title:
-                        logger.info(f"✅ Заголовок найден через '{selector}': {title[:50]}...")
-                        return title
-                except:
-                    continue
-            
-            logger.warning("⚠️ Заголовок не найден")
-            return ""
-            
-        except Exception as e:
-            logger.error(f"❌ Ошибка извлечения заголовка: {e}")
-            return ""
-    
-    def _extract_description(self, driver) -> str:
-        """Извлекает описание статьи"""
+    def _extract_metadata(self, driver) -> Dict[str, str]:
+        """
+        Извлекает заголовок, описание, дату и og/twitter изображения одним вызовом JS
+        
+        Каждый find_element/get_attribute - отдельный запрос к chromedriver; здесь все
+        селекторы проверяются в браузере за один execute_script
+        
+        Returns:
+            {'title', 'description', 'published', 'og_image', 'twitter_image'} ('' если не найдено)
+        """
         try:
-            selectors = [
-                'p[class*="Standfirst"]',
-                'p[data-trackable="standfirst"]',
-                'div.article__standfirst p',
-                'div.topper__standfirst p',
-                'meta[property="og:description"]',
-                'meta[name="description"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    if 'meta' in selector:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        desc = element.get_attribute('content')
-                    else:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        desc = element.text.strip()
-                    
-                    if desc:
-                        logger.info(f"✅ Описание найдено через '{selector}'")
-                        return desc
-                except:
-                    continue
-            
-            return ""
-            
+            found = driver.execute_script(METADATA_JS, METADATA_SELECTORS) or {}
         except Exception as e:
-            logger.error(f"❌ Ошибка извлечения описания: {e}")
-            return ""
+            logger.error(f"❌ Ошибка извлечения метаданных: {e}")
+            found = {}
+        
+        metadata = {}
+        for field in METADATA_SELECTORS:
+            selector, value = found.get(field) or (None, '')
+            metadata[field] = value
+            if selector:
+                logger.debug(f"✅ {field} найдено через '{selector}'")
+        
+        if metadata['title']:
+            logger.info(f"✅ Заголовок найден: {metadata['title'][:50]}...")
+        else:
+            logger.warning("⚠️ Заголовок не найден")
+        if metadata['published']:
+            logger.info(f"✅ Дата найдена: {metadata['published']}")
+        
+        return metadata
     
     def _extract_content_from_jsonld(self, driver) -> str:
         """Извлекает контент из JSON-LD (структурированные данные)"""
         try:
-            from bs4 import BeautifulSoup
-            import json
-            
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Ищем все script теги с type="application/ld+json"
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
+            # Тексты всех script type="application/ld+json" берем прямо из браузера:
+            # без передачи и разбора всего HTML страницы
+            payloads = driver.execute_script(JSON_LD_JS) or []
             
-            for script in json_ld_scripts:
+            for payload in payloads:
                 try:
-                    if not script.string:
+                    if not payload or not payload.strip():
                         continue
                     
-                    data = json.loads(script.string)
+                    data = _loads_json(payload)
                     
                     # Поддерживаем как одиночные объекты, так и массивы
                     items = data if isinstance(data, list) else [data]
@@ -534,13 +699,11 @@ class FinancialTimesEngine(SourceEngine):
                 try:
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
-                        temp_paragraphs = []
-                        for element in elements:
-                            text = element.text.strip()
-                            # Фильтруем параграфы: минимум 20 символов, не навигация
-                            if text and len(text) > 20 and not text.startswith('Read') and not text.startswith('Related'):
-                                if text not in temp_paragraphs:
-                                    temp_paragraphs.append(text)
+                        texts = (element.text.strip() for element in elements)
+                        # Фильтруем параграфы: минимум 20 символов, не навигация; повторы убираем с сохранением порядка
+                        temp_paragraphs = list(dict.fromkeys(
+                            text for text in texts if len(text) > 20 and not text.startswith(NAVIGATION_PREFIXES)
+                        ))
                         
                         if len(temp_paragraphs) >= 3:
                             paragraphs = temp_paragraphs
@@ -551,45 +714,35 @@ class FinancialTimesEngine(SourceEngine):
                     logger.debug(f"Ошибка с селектором '{selector}': {e}")
                     continue
             
-            # Если мало контента, пробуем BeautifulSoup как альтернативу
+            # Если мало контента, разбираем HTML страницы целиком как альтернативу
             if len(paragraphs) < 5:
-                logger.info("⚠️ Мало параграфов через Selenium, пробуем BeautifulSoup...")
+                logger.info("⚠️ Мало параграфов через Selenium, разбираем HTML...")
                 try:
-                    from bs4 import BeautifulSoup
                     html = driver.page_source
-                    soup = BeautifulSoup(html, 'html.parser')
+                    tree = _parse_html(html)
                     
-                    # Ищем article body через BeautifulSoup
+                    # Ищем article body в разобранном HTML
                     article_selectors = [
-                        {'name': 'div', 'class_': lambda x: x and 'ArticleBody' in str(x)},
-                        {'name': 'div', 'attrs': {'data-trackable': 'article-body'}},
-                        {'name': 'article'},
+                        'div[class*="ArticleBody"]',
+                        'div[data-trackable="article-body"]',
+                        'article',
                     ]
                     
                     for sel in article_selectors:
-                        if 'class_' in sel:
-                            article_body = soup.find(sel['name'], class_=sel['class_'])
-                        elif 'attrs' in sel:
-                            article_body = soup.find(sel['name'], **sel['attrs'])
-                        else:
-                            article_body = soup.find(sel['name'])
+                        article_body = _css_first(tree, sel)
                         
                         if article_body:
                             # Извлекаем все параграфы из найденного контейнера
-                            ps = article_body.find_all('p')
-                            temp_paragraphs = []
-                            for p in ps:
-                                text = p.get_text().strip()
-                                if text and len(text) > 20:
-                                    if text not in temp_paragraphs:
-                                        temp_paragraphs.append(text)
+                            ps = _css(article_body, 'p')
+                            texts = (_text(p).strip() for p in ps)
+                            temp_paragraphs = list(dict.fromkeys(text for text in texts if len(text) > 20))
                             
                             if len(temp_paragraphs) > len(paragraphs):
                                 paragraphs = temp_paragraphs
-                                logger.info(f"✅ BeautifulSoup: найдено {len(paragraphs)} параграфов")
+                                logger.info(f"✅ Разбор HTML: найдено {len(paragraphs)} параграфов")
                                 break
                 except Exception as e:
-                    logger.debug(f"BeautifulSoup fallback не сработал: {e}")
+                    logger.debug(f"Fallback разбора HTML не сработал: {e}")
             
             # Если все еще мало, используем весь body text
             if not paragraphs or len(paragraphs) < 3:
@@ -615,62 +768,22 @@ class FinancialTimesEngine(SourceEngine):
             logger.error(f"❌ Ошибка извлечения контента: {e}")
             return ""
     
-    def _extract_publish_date(self, driver) -> str:
-        """Извлекает дату публикации"""
-        try:
-            selectors = [
-                'time[datetime]',
-                'meta[property="article:published_time"]',
-                'meta[name="date"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if 'meta' in selector:
-                        date = element.get_attribute('content')
-                    else:
-                        date = element.get_attribute('datetime')
-                    
-                    if date:
-                        logger.info(f"✅ Дата найдена: {date}")
-                        return date
-                except:
-                    continue
-            
-            # Используем текущую дату как fallback
-            from datetime import datetime
-            return datetime.now().isoformat()
-            
-        except Exception as e:
-            logger.error(f"❌ Ошибка извлечения даты: {e}")
-            from datetime import datetime
-            return datetime.now().isoformat()
-    
-    def _extract_images(self, driver) -> List[str]:
-        """Извлекает изображения из статьи"""
+    def _extract_images(self, driver, metadata: Dict[str, str]) -> List[str]:
+        """Извлекает изображения из статьи (og/twitter изображения - из _extract_metadata)"""
         try:
             images = []
             
-            # ВАЖНО: Сначала пробуем получить og:image как fallback для paywall
-            try:
-                og_image = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                og_image_url = og_image.get_attribute('content')
-                if og_image_url:
-                    logger.info(f"📸 Найдено og:image: {og_image_url[:100]}...")
-                    images.append(og_image_url)
-            except:
-                pass
+            # ВАЖНО: Сначала берем og:image как fallback для paywall
+            og_image_url = metadata.get('og_image')
+            if og_image_url:
+                logger.info(f"📸 Найдено og:image: {og_image_url[:100]}...")
+                images.append(og_image_url)
             
-            # Пробуем найти twitter:image
-            try:
-                twitter_image = driver.find_element(By.CSS_SELECTOR, 'meta[name="twitter:image"]')
-                twitter_image_url = twitter_image.get_attribute('content')
-                if twitter_image_url and twitter_image_url not in images:
-                    logger.info(f"📸 Найдено twitter:image: {twitter_image_url[:100]}...")
-                    images.append(twitter_image_url)
-            except:
-                pass
+            # Затем twitter:image
+            twitter_image_url = metadata.get('twitter_image')
+            if twitter_image_url and twitter_image_url not in images:
+                logger.info(f"📸 Найдено twitter:image: {twitter_image_url[:100]}...")
+                images.append(twitter_image_url)
             
             # Ищем изображения в article body
             selectors = [
@@ -699,11 +812,8 @@ class FinancialTimesEngine(SourceEngine):
                             if 'srcset' in str(src) or ',' in str(src):
                                 src = src.split(',')[0].split(' ')[0]
                             
-                            # Фильтруем изображения
-                            src_lower = src.lower()
-                            
                             # Пропускаем иконки и маленькие изображения
-                            if any(skip in src_lower for skip in ['icon', 'logo', 'avatar', 'placeholder']):
+                            if _SKIP_IMAGE_RE.search(src):
                                 continue
                             
                             # Пропускаем слишком маленькие изображения
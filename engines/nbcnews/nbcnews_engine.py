@@ -17,27 +17,21 @@ from ..base.source_engine import SourceEngine
 
 logger = logging.getLogger(__name__)
 
+# Проверки URL медиа без url.lower(): регулярки сразу без учета регистра
+_IMAGE_EXT_RE = re.compile(r'\.(?:jpg|jpeg|png|gif|webp)\Z', re.IGNORECASE)
+_IMAGE_HINT_RE = re.compile(r'image|photo', re.IGNORECASE)
+_VIDEO_EXT_RE = re.compile(r'\.(?:mp4|webm|ogg|mov|m3u8|ts)\Z', re.IGNORECASE)
+_VIDEO_HINT_RE = re.compile(r'video|stream', re.IGNORECASE)
+
 class NBCNewsEngine(SourceEngine):
     """Движок для парсинга NBC News"""
     
+    SOURCE_NAME = "NBC News"
+    SUPPORTED_DOMAINS = ('nbcnews.com', 'www.nbcnews.com')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
     
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return [
-            "nbcnews.com",
-            "www.nbcnews.com"
-        ]
-    
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "NBC News"
-    
-    def can_handle(self, url: str) -> bool:
-        """Проверяет, может ли обработать URL"""
-        return any(domain in url.lower() for domain in self.supported_domains)
-    
     def get_engine_info(self) -> Dict[str, Any]:
         """Возвращает информацию о движке"""
         return {
@@ -420,8 +414,7 @@ class NBCNewsEngine(SourceEngine):
             return False
         
         # Проверяем, что это изображение по расширению
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        if any(url.lower().endswith(ext) for ext in image_extensions):
+        if _IMAGE_EXT_RE.search(url):
             return True
         
         # Проверяем домены NBC News
@@ -431,7 +424,7 @@ class NBCNewsEngine(SourceEngine):
             return True
         
         # Проверяем, что URL содержит параметры изображения
-        if 'image' in url.lower() or 'photo' in url.lower():
+        if _IMAGE_HINT_RE.search(url):
             return True
         
         return False
@@ -446,8 +439,7 @@ class NBCNewsEngine(SourceEngine):
             return False
         
         # Проверяем видео расширения
-        video_extensions = ['.mp4', '.webm', '.ogg', '.mov', '.m3u8', '.ts']
-        if any(url.lower().endswith(ext) for ext in video_extensions):
+        if _VIDEO_EXT_RE.search(url):
             return True
         
         # Проверяем видео платформы
@@ -457,7 +449,7 @@ class NBCNewsEngine(SourceEngine):
             return True
         
         # Проверяем, что URL содержит параметры видео
-        if 'video' in url.lower() or 'stream' in url.lower():
+        if _VIDEO_HINT_RE.search(url):
             return True
         
         return False
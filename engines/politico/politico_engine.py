@@ -2,7 +2,7 @@
 Politico news source engine
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 import logging
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 import re
@@ -14,49 +14,39 @@ logger = logging.getLogger(__name__)
 class PoliticoMediaExtractor(MediaExtractor):
     """Извлекатель медиа для Politico"""
     
-    def extract_images(self, url: str, content: Dict[str, Any]) -> List[str]:
+    __slots__ = ()
+    
+    # Fallback изображения по теме заголовка (порядок групп - приоритет)
+    FALLBACK_MAP = {
+        # Политические темы - изображение заседания комитета
+        **dict.fromkeys(
+            ['cruz', 'senator', 'congress', 'senate', 'house', 'judiciary', 'committee', 'subpoena', 'epstein'],
+            ['https://images.unsplash.com/photo-1578662996442-48f60103fc96?w=1280&h=720&fit=crop&crop=center']),
+        # Конституционные темы
+        **dict.fromkeys(
+            ['amendment', 'constitution', 'first amendment', 'free speech'],
+            ['https://images.unsplash.com/photo-1551698618-1dfe5d97d256?w=1280&h=720&fit=crop&crop=center']),
+        # Президентские темы
+        **dict.fromkeys(
+            ['trump', 'biden', 'election', 'president'],
+            ['https://images.unsplash.com/photo-1551524164-6cf2ac5313f4?w=1280&h=720&fit=crop&crop=center']),
+    }
+    # Общая тематика
+    FALLBACK_DEFAULT = ['https://images.unsplash.com/photo-1586339949916-3e9457bef6d3?w=1280&h=720&fit=crop&crop=center']
+    
+    def extract_images(self, url: str, content: Dict[str, Any]) -> Iterator[str]:
         """Извлекает изображения из контента Politico"""
-        images = []
-        
         # Извлекаем изображения из content
-        if 'images' in content:
-            for img_url in content['images']:
-                if self.validate_image_url(img_url):
-                    images.append(img_url)
-        
-        return images
+        for img_url in content.get('images') or ():
+            if self.validate_image_url(img_url):
+                yield img_url
     
-    def extract_videos(self, url: str, content: Dict[str, Any]) -> List[str]:
+    def extract_videos(self, url: str, content: Dict[str, Any]) -> Iterator[str]:
         """Извлекает видео из контента Politico"""
-        videos = []
-        
         # Извлекаем видео из content
-        if 'videos' in content:
-            for vid_url in content['videos']:
-                if self.validate_video_url(vid_url):
-                    videos.append(vid_url)
-        
-        return videos
-    
-    def get_fallback_images(self, title: str) -> List[str]:
-        """Возвращает fallback изображения для Politico"""
-        title_lower = title.lower()
-        
-        # Политические темы - изображение заседания комитета
-        if any(word in title_lower for word in ['cruz', 'senator', 'congress', 'senate', 'house', 'judiciary', 'committee', 'subpoena', 'epstein']):
-            return ['https://images.unsplash.com/photo-1578662996442-48f60103fc96?w=1280&h=720&fit=crop&crop=center']
-        
-        # Конституционные темы
-        elif any(word in title_lower for word in ['amendment', 'constitution', 'first amendment', 'free speech']):
-            return ['https://images.unsplash.com/photo-1551698618-1dfe5d97d256?w=1280&h=720&fit=crop&crop=center']
-        
-        # Президентские темы
-        elif any(word in title_lower for word in ['trump', 'biden', 'election', 'president']):
-            return ['https://images.unsplash.com/photo-1551524164-6cf2ac5313f4?w=1280&h=720&fit=crop&crop=center']
-        
-        # Общая тематика
-        else:
-            return ['https://images.unsplash.com/photo-1586339949916-3e9457bef6d3?w=1280&h=720&fit=crop&crop=center']
+        for vid_url in content.get('videos') or ():
+            if self.validate_video_url(vid_url):
+                yield vid_url
 
 
 class PoliticoContentValidator(ContentValidator):
@@ -78,24 +68,15 @@ class PoliticoEngine(SourceEngine):
     Движок для обработки новостей Politico
     """
     
+    SOURCE_NAME = "POLITICO"
+    SUPPORTED_DOMAINS = ('politico.com', 'www.politico.com', 'politico.eu', 'www.politico.eu')
+    
     def __init__(self, config: Dict[str, Any]):
         """Инициализация движка Politico"""
         super().__init__(config)
         self.media_extractor = PoliticoMediaExtractor(config)
         self.content_validator = PoliticoContentValidator(config)
     
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "POLITICO"
-    
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return ['politico.com', 'www.politico.com', 'politico.eu', 'www.politico.eu']
-    
-    def can_handle(self, url: str) -> bool:
-        """Проверяет, может ли обработать URL"""
-        return any(domain in url.lower() for domain in self.supported_domains)
-    
     def parse_url(self, url: str, driver=None) -> Dict[str, Any]:
         """
         Парсит URL Politico используя Selenium для правильного заголовка + Tavily для медиа
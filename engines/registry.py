@@ -4,7 +4,9 @@ Registry for news source engines
 
 from typing import Dict, List, Optional, Type
 from .base import SourceEngine
+from .base.driver_pool import driver_pool
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +15,30 @@ class EngineRegistry:
     """
     Реестр движков новостных источников
     
-    Автоматически выбирает подходящий движок для URL
+    Автоматически выбирает подходящий движок для URL.
+    Экземпляры создаются один раз, с общей конфигурацией (configure), под блокировкой:
+    реестр используют несколько потоков
     """
     
     def __init__(self):
         """Инициализация реестра"""
         self.engines: Dict[str, Type[SourceEngine]] = {}
         self.engine_instances: Dict[str, SourceEngine] = {}
+        self.config: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def configure(self, config: Dict):
+        """
+        Задает конфигурацию, с которой создаются все экземпляры движков,
+        и размер общего пула Chrome (news_parser.selenium_pool_size)
+        
+        Args:
+            config: Конфигурация
+        """
+        self.config = config
+        pool_size = (config.get('news_parser') or {}).get('selenium_pool_size')
+        if pool_size:
+            driver_pool.size = int(pool_size)
     
     def register_engine(self, name: str, engine_class: Type[SourceEngine]):
         """
@@ -49,40 +68,72 @@ class EngineRegistry:
         
         try:
             engine = self.engines[name](config)
-            self.engine_instances[name] = engine
+            with self._lock:
+                self.engine_instances[name] = engine
             return engine
         except Exception as e:
             logger.error(f"Ошибка создания движка {name}: {e}")
             return None
     
-    def get_engine_for_url(self, url: str, config: Dict) -> Optional[SourceEngine]:
+    def discard_engine(self, engine: SourceEngine):
+        """
+        Удаляет экземпляр из реестра: для следующего URL движок будет создан заново
+        
+        Args:
+            engine: Экземпляр движка
+        """
+        with self._lock:
+            for name, instance in list(self.engine_instances.items()):
+                if instance is engine:
+                    del self.engine_instances[name]
+                    logger.info(f"♻️ Экземпляр движка {name} будет пересоздан")
+
+    def get_engine_for_url(self, url: str, config: Optional[Dict] = None) -> Optional[SourceEngine]:
         """
         Возвращает подходящий движок для URL
         
         Args:
             url: URL для обработки
-            config: Конфигурация
+            config: Конфигурация для создания движков, если реестр не настроен через configure
             
         Returns:
             Подходящий движок или None
         """
-        # Сначала проверяем существующие экземпляры
-        for name, engine in self.engine_instances.items():
+        # Быстрый путь: класс движка по хосту из общего дерева доменов
+        engine_class = SourceEngine.route(url)
+        if engine_class is not None:
+            for name, engine in list(self.engine_instances.items()):
+                if type(engine) is engine_class and engine.can_handle(url):
+                    logger.info(f"🎯 Выбран движок {name} для URL: {url[:50]}...")
+                    return engine
+        
+        # Затем проверяем существующие экземпляры (копия: реестр используют несколько потоков)
+        for name, engine in list(self.engine_instances.items()):
             if engine.can_handle(url):
                 logger.info(f"🎯 Выбран движок {name} для URL: {url[:50]}...")
                 return engine
         
-        # Если не найден, создаем новые экземпляры
-        for name, engine_class in self.engines.items():
-            try:
-                engine = engine_class(config)
-                if engine.can_handle(url):
+        # Если не найден, создаем экземпляры еще не созданных движков.
+        # Экземпляр сохраняется даже если URL ему не подходит, чтобы не создавать его заново.
+        # Под блокировкой: второй поток дождется и возьмет уже созданный экземпляр
+        engine_config = self.config if self.config is not None else (config or {})
+        with self._lock:
+            for name, engine_class in list(self.engines.items()):
+                engine = self.engine_instances.get(name)
+                if engine is None:
+                    try:
+                        engine = engine_class(engine_config)
+                    except Exception as e:
+                        logger.warning(f"Ошибка создания движка {name}: {e}")
+                        continue
                     self.engine_instances[name] = engine
-                    logger.info(f"🎯 Создан и выбран движок {name} для URL: {url[:50]}...")
+                    if engine.can_handle(url):
+                        logger.info(f"🎯 Создан и выбран движок {name} для URL: {url[:50]}...")
+                        return engine
+                elif engine.can_handle(url):
+                    # Создан другим потоком, пока этот ждал блокировку
+                    logger.info(f"🎯 Выбран движок {name} для URL: {url[:50]}...")
                     return engine
-            except Exception as e:
-                logger.warning(f"Ошибка создания движка {name}: {e}")
-                continue
         
         logger.warning(f"❌ Не найден подходящий движок для URL: {url[:50]}...")
         return None
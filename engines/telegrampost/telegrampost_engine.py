@@ -17,18 +17,13 @@ logger = logging.getLogger(__name__)
 class TelegramPostEngine(SourceEngine):
     """Движок для обработки прямых постов из Telegram"""
     
+    SOURCE_NAME = "Telegram Post"
+    SUPPORTED_DOMAINS = ('telegram://post', 'tg://post')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.bot_token = config.get('telegram', {}).get('bot_token', '')
     
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены (специальный маркер для Telegram)"""
-        return ['telegram://post', 'tg://post']
-    
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "Telegram Post"
-    
     def can_handle(self, url: str) -> bool:
         """
         Проверяет, может ли обработать URL
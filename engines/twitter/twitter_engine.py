@@ -4,7 +4,7 @@ Twitter Engine для парсинга твитов
 
 import logging
 import re
-from typing import Dict, List, Any
+from typing import Dict, Any
 from urllib.parse import urlparse
 
 # Настройка логирования для подавления предупреждений
@@ -18,20 +18,34 @@ from ..base.source_engine import SourceEngine
 
 logger = logging.getLogger(__name__)
 
+# Признаки страницы-заглушки X вместо твита; регистр не важен, поэтому
+# текст не копируется через lower(), а просматривается одной регуляркой
+BLOCKED_CONTENT_INDICATORS = (
+    'something went wrong',
+    'try again',
+    'privacy related extensions',
+    'disable them and try again',
+    'this page is not available',
+    'tweet unavailable',
+    'tweet not found',
+    'don\'t fret',
+    'give it another shot'
+)
+_BLOCKED_CONTENT_RE = re.compile('|'.join(map(re.escape, BLOCKED_CONTENT_INDICATORS)), re.IGNORECASE)
+
 
 class TwitterEngine(SourceEngine):
     """Движок для парсинга Twitter/X"""
     
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "TWITTER"
+    SOURCE_NAME = "TWITTER"
+    SUPPORTED_DOMAINS = ('x.com', 'www.x.com', 'twitter.com', 'www.twitter.com')
     
     def can_handle(self, url: str) -> bool:
         """Проверяет, может ли движок обработать URL"""
         try:
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
-            return domain in self._get_supported_domains()
+            return domain in self.supported_domains
         except Exception:
             return False
     
@@ -434,24 +448,7 @@ class TwitterEngine(SourceEngine):
         if not content:
             return False
         
-        blocked_indicators = [
-            'something went wrong',
-            'try again',
-            'privacy related extensions',
-            'disable them and try again',
-            'this page is not available',
-            'tweet unavailable',
-            'tweet not found',
-            'don\'t fret',
-            'give it another shot'
-        ]
-        
-        content_lower = content.lower()
-        for indicator in blocked_indicators:
-            if indicator in content_lower:
-                return True
-        
-        return False
+        return _BLOCKED_CONTENT_RE.search(content) is not None
     
     def _get_fallback_content(self) -> Dict[str, Any]:
         """Возвращает fallback контент"""
@@ -465,7 +462,3 @@ class TwitterEngine(SourceEngine):
             'source': 'TWITTER',
             'content_type': 'social_media_post'
         }
-    
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return ['x.com', 'www.x.com', 'twitter.com', 'www.twitter.com']
@@ -4,6 +4,7 @@ Twitter Media Manager для обработки медиа из Twitter/X
 
 import logging
 import re
+from itertools import islice
 from typing import Dict, List, Any
 from pathlib import Path
 from bs4 import BeautifulSoup
@@ -19,6 +20,9 @@ from scripts.video_preprocessor import VideoPreprocessor
 
 logger = logging.getLogger(__name__)
 
+# Прямые ссылки на mp4 в HTML страницы (запасной поиск видео)
+_MP4_URL_RE = re.compile(r'https://[^"\s]*\.mp4[^"\s]*')
+
 
 class TwitterMediaManager(MediaManager):
     """Специализированный медиа-менеджер для Twitter"""
@@ -834,11 +838,11 @@ class TwitterMediaManager(MediaManager):
                     logger.warning("❌ Видео элементы не найдены на странице")
                     # Попробуем найти прямые ссылки на видео в HTML
                     page_source = driver.page_source
-                    import re
-                    video_urls = re.findall(r'https://[^"\s]*\.mp4[^"\s]*', page_source)
+                    # Берем первые 3 ссылки: поиск останавливается, не просматривая остаток страницы
+                    video_urls = [m.group(0) for m in islice(_MP4_URL_RE.finditer(page_source), 3)]
                     if video_urls:
                         logger.info(f"🔍 Найдено {len(video_urls)} прямых ссылок на видео в HTML")
-                        for video_url in video_urls[:3]:  # Берем первые 3
+                        for video_url in video_urls:
                             try:
                                 logger.info(f"🎥 Пробуем скачать: {video_url[:50]}...")
                                 response = requests.get(video_url, stream=True, timeout=60)
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 class WashingtonPostMediaExtractor(MediaExtractor):
+    __slots__ = ()
+
     def extract_images(self, url: str, content: Dict[str, Any]) -> List[str]:
         images = []
         for img in content.get('images', []) or []:
@@ -37,20 +39,14 @@ class WashingtonPostContentValidator(ContentValidator):
 
 
 class WashingtonPostEngine(SourceEngine):
+    SOURCE_NAME = "WASHINGTON POST"
+    SUPPORTED_DOMAINS = ('washingtonpost.com', 'www.washingtonpost.com')
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.media_extractor = WashingtonPostMediaExtractor(config)
         self.content_validator = WashingtonPostContentValidator(config)
 
-    def _get_source_name(self) -> str:
-        return "WASHINGTON POST"
-
-    def _get_supported_domains(self) -> List[str]:
-        return ['washingtonpost.com', 'www.washingtonpost.com']
-
-    def can_handle(self, url: str) -> bool:
-        return any(domain in url.lower() for domain in self.supported_domains)
-
     def parse_url(self, url: str, driver=None) -> Dict[str, Any]:
         logger.info(f"🔍 Парсинг WashingtonPost URL: {url[:50]}...")
         try:
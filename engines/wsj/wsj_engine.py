@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class WSJMediaExtractor(MediaExtractor):
     """Извлекатель медиа для Wall Street Journal"""
     
+    __slots__ = ()
+    
     def extract_images(self, url: str, content: Dict[str, Any]) -> List[str]:
         """Извлекает изображения из контента WSJ"""
         images = []
@@ -58,24 +60,15 @@ class WSJEngine(SourceEngine):
     Движок для обработки новостей Wall Street Journal
     """
     
+    SOURCE_NAME = "Wall Street Journal"
+    SUPPORTED_DOMAINS = ('wsj.com', 'www.wsj.com')
+    
     def __init__(self, config: Dict[str, Any]):
         """Инициализация движка WSJ"""
         super().__init__(config)
         self.media_extractor = WSJMediaExtractor(config)
         self.content_validator = WSJContentValidator(config)
     
-    def _get_source_name(self) -> str:
-        """Возвращает название источника"""
-        return "Wall Street Journal"
-    
-    def _get_supported_domains(self) -> List[str]:
-        """Возвращает поддерживаемые домены"""
-        return ['wsj.com', 'www.wsj.com']
-    
-    def can_handle(self, url: str) -> bool:
-        """Проверяет, может ли обработать URL"""
-        return any(domain in url.lower() for domain in self.supported_domains)
-    
     def parse_url(self, url: str, driver=None) -> Dict[str, Any]:
         """
         Парсит URL новости Wall Street Journal
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Подключение к SQLite базе новостей с настроенными PRAGMA
+"""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = 'data/user_news.db'
+
+# WAL: читатели не блокируют писателя; synchronous=NORMAL в WAL безопасен и не делает fsync на каждую транзакцию
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA mmap_size=134217728;"
+)
+
+
+def open_db(path: str = DB_PATH, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Открывает базу данных в режиме autocommit (транзакции - явным BEGIN)
+
+    Args:
+        path: Путь к файлу базы данных
+        readonly: Открыть только для чтения (mode=ro, файл не создается)
+
+    Returns:
+        Соединение с базой данных
+    """
+    if readonly:
+        conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
+    else:
+        conn = sqlite3.connect(path, isolation_level=None)
+        # Режим журнала хранится в файле БД, менять его может только пишущее соединение
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_PRAGMAS)
+    return conn
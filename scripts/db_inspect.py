@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Проверка и очистка базы новостей одной командой
+
+Все проверки выполняются через одно соединение (PRAGMA и кэш страниц SQLite общие):
+    python -m scripts.db_inspect tables schema politico urls
+    python -m scripts.db_inspect diag    # schema + politico + urls одним запросом
+    python -m scripts.db_inspect cleanup
+"""
+
+import argparse
+import functools
+import os
+import sqlite3
+
+from scripts.db import DB_PATH, open_db
+from scripts.db_writer import WriterQueue
+
+# Тестовая ссылка, записи с которой удаляются
+TEST_URL = "https://x.com/EricLDaugh/status/1969037987330621441"
+
+# Условие "нет медиа" общее для частичного индекса и удаления - так SQLite использует индекс
+NO_MEDIA_CONDITION = "(images IS NULL OR images = '') AND (videos IS NULL OR videos = '')"
+
+COUNT_SQL = "SELECT COUNT(*) FROM user_news"
+CREATE_NO_MEDIA_INDEX_SQL = f"CREATE INDEX IF NOT EXISTS idx_no_media ON user_news(id) WHERE {NO_MEDIA_CONDITION}"
+CREATE_RECEIVED_AT_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_received_at ON user_news(received_at)"
+DELETE_TEST_URL_SQL = "DELETE FROM user_news WHERE url = ?"
+DELETE_NO_MEDIA_SQL = f"DELETE FROM user_news WHERE {NO_MEDIA_CONDITION}"
+DELETE_OLD_SQL = "DELETE FROM user_news WHERE received_at < datetime('now', '-1 day')"
+
+POLITICO_SQL = (
+    "SELECT id, title, images, videos, processed FROM user_news "
+    "WHERE url LIKE '%epstein-case%' ORDER BY id DESC LIMIT 20"
+)
+URLS_SQL = (
+    "SELECT id, source, images FROM user_news "
+    "WHERE images IS NOT NULL AND images != '' ORDER BY id DESC LIMIT 5"
+)
+
+# schema + politico + urls одним запросом; kind определяет, как печатать строку,
+# отсутствующие в части колонки заполнены NULL
+DIAGNOSTICS_SQL = f"""
+    SELECT 'schema' AS kind, cid AS id, name, type, NULL AS title, NULL AS source,
+           NULL AS images, NULL AS videos, NULL AS processed
+    FROM pragma_table_info('user_news')
+    UNION ALL
+    SELECT * FROM (SELECT 'politico', id, NULL, NULL, title, NULL, images, videos, processed
+                   FROM ({POLITICO_SQL}))
+    UNION ALL
+    SELECT * FROM (SELECT 'urls', id, NULL, NULL, NULL, source, images, NULL, NULL
+                   FROM ({URLS_SQL}))
+"""
+
+
+@functools.cache
+def _conn() -> sqlite3.Connection:
+    """Общее соединение процесса с базой новостей"""
+    conn = open_db(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def show_tables(conn: sqlite3.Connection):
+    """Таблицы и количество записей, индексы и режим журнала"""
+    cursor = conn.cursor()
+    # Все подсчеты в одной читающей транзакции: согласованный снимок, пока монитор пишет в БД
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in cursor.fetchall()]
+        print("Tables:", tables)
+
+        for table_name in tables:
+            cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+            print(f"Table {table_name}: {cursor.fetchone()[0]} records")
+
+        cursor.execute("SELECT name, tbl_name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL")
+        for row in cursor:
+            print(f"Index {row['name']} on {row['tbl_name']}")
+
+        cursor.execute("PRAGMA journal_mode")
+        print("Journal mode:", cursor.fetchone()[0])
+    finally:
+        conn.rollback()
+
+
+def _print_schema_row(col: sqlite3.Row):
+    print(f"  {col['name']} ({col['type']})")
+
+
+def _print_politico_row(row: sqlite3.Row):
+    print(f'ID: {row["id"]}, Title: {(row["title"] or "")[:50]}..., Images: {row["images"]}, Videos: {row["videos"]}, Processed: {row["processed"]}')
+
+
+def _print_urls_row(row: sqlite3.Row):
+    news_id, source, images = row['id'], row['source'], row['images']
+    print(f"\n=== ID {news_id}, Source: {source} ===")
+    print(f"Images: {images[:200]}...")
+
+    # Проверяем, есть ли запятые в URL
+    if ',' in images:
+        print("⚠️  Содержит запятые в URL!")
+    else:
+        print("✅ Нет запятых в URL")
+
+
+# Заголовок и печать строки для каждой части диагностики
+_SECTIONS = {
+    'schema': ("Columns in user_news table:", _print_schema_row),
+    'politico': ('📰 Последние новости Politico:', _print_politico_row),
+    'urls': (None, _print_urls_row),
+}
+
+
+def show_schema(conn: sqlite3.Connection):
+    """Колонки таблицы user_news"""
+    print("Columns in user_news table:")
+    for col in conn.execute("PRAGMA table_info(user_news)"):
+        _print_schema_row(col)
+
+
+def show_politico(conn: sqlite3.Connection):
+    """Последние новости Politico"""
+    cursor = conn.execute(POLITICO_SQL)
+
+    print('📰 Последние новости Politico:')
+    for row in cursor:
+        _print_politico_row(row)
+
+
+def show_urls(conn: sqlite3.Connection):
+    """Проверяем URL изображений в разных движках"""
+    try:
+        # Получаем последние 5 новостей с изображениями
+        for row in conn.execute(URLS_SQL):
+            _print_urls_row(row)
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+
+
+def show_diagnostics(conn: sqlite3.Connection):
+    """schema, politico и urls одним запросом UNION ALL"""
+    try:
+        current_kind = None
+        for row in conn.execute(DIAGNOSTICS_SQL):
+            header, print_row = _SECTIONS[row['kind']]
+            if row['kind'] != current_kind:
+                current_kind = row['kind']
+                if header:
+                    print(header)
+            print_row(row)
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+
+
+def cleanup(conn: sqlite3.Connection):
+    """Очищает базу данных от тестовых записей"""
+    try:
+        cursor = conn.cursor()
+
+        # Получаем количество записей до очистки
+        cursor.execute(COUNT_SQL)
+        count_before = cursor.fetchone()[0]
+
+        print(f"📊 Записей в базе до очистки: {count_before}")
+
+        # в старых схемах нет колонки received_at
+        has_received_at = any(col['name'] == 'received_at' for col in cursor.execute("PRAGMA table_info(user_news)"))
+
+        # Индексы под условия удаления: частичный - для записей без медиа, по received_at - для старых
+        statements = [(CREATE_NO_MEDIA_INDEX_SQL, ())]
+        if has_received_at:
+            statements.append((CREATE_RECEIVED_AT_INDEX_SQL, ()))
+
+        # Удаляем все записи с тестовым URL и записи без медиа (нет images и videos),
+        # старше 1 дня - по received_at
+        deletes = [(DELETE_TEST_URL_SQL, (TEST_URL,)), (DELETE_NO_MEDIA_SQL, ())]
+        if has_received_at:
+            deletes.append((DELETE_OLD_SQL, ()))
+
+        # Все изменения - одна транзакция единственного писателя, без конкуренции за блокировку записи
+        with WriterQueue(DB_PATH) as writer:
+            rowcounts = writer.submit(statements + deletes).result()[len(statements):]
+        deleted_count, no_media_count, old_count = (rowcounts + [0])[:3]
+
+        # Получаем количество записей после очистки
+        cursor.execute(COUNT_SQL)
+        count_after = cursor.fetchone()[0]
+
+        print(f"✅ Очистка завершена:")
+        print(f"  - Удалено записей с тестовым URL: {deleted_count}")
+        print(f"  - Удалено записей без медиа: {no_media_count}")
+        print(f"  - Удалено старых записей: {old_count}")
+        print(f"  - Записей в базе после очистки: {count_after}")
+
+    except Exception as e:
+        print(f"❌ Ошибка очистки базы: {e}")
+
+
+COMMANDS = {
+    'tables': show_tables,
+    'schema': show_schema,
+    'politico': show_politico,
+    'urls': show_urls,
+    'diag': show_diagnostics,
+    'cleanup': cleanup,
+}
+
+
+def main(argv=None):
+    """Выполняет указанные команды по очереди на общем соединении"""
+    parser = argparse.ArgumentParser(description="Проверка и очистка базы новостей")
+    parser.add_argument('commands', nargs='+', choices=list(COMMANDS))
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(DB_PATH):
+        print("❌ База данных не найдена")
+        return
+
+    try:
+        for command in args.commands:
+            COMMANDS[command](_conn())
+    finally:
+        _conn().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Единственный пишущий поток для базы новостей
+
+Все изменения идут через одно соединение в отдельном потоке и выполняются по очереди,
+каждая пачка - в своей транзакции BEGIN IMMEDIATE. Читатели открывают свои соединения
+(open_db(readonly=True)) и в WAL не мешают писателю.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Sequence, Tuple
+
+from scripts.db import DB_PATH, open_db
+
+logger = logging.getLogger(__name__)
+
+Statement = Tuple[str, Sequence]
+
+
+class WriterQueue:
+    """Очередь изменений БД, которую выполняет один поток-писатель"""
+
+    def __init__(self, path: str = DB_PATH):
+        """
+        Args:
+            path: Путь к файлу базы данных
+        """
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, statements: Sequence[Statement]) -> Future:
+        """
+        Ставит пачку запросов в очередь на запись
+
+        Args:
+            statements: Пары (sql, params), выполняются в одной транзакции
+
+        Returns:
+            Future со списком rowcount по каждому запросу
+        """
+        future = Future()
+        self._queue.put((list(statements), future))
+        return future
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        """Выполняет один запрос через писателя и ждет результат (rowcount)"""
+        return self.submit([(sql, params)]).result()[0]
+
+    def close(self):
+        """Дожидается выполнения поставленных запросов и закрывает соединение"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _loop(self):
+        # Соединение создается и используется только в потоке писателя
+        conn = open_db(self.path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                statements, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    rowcounts = [conn.execute(sql, params).rowcount for sql, params in statements]
+                    conn.execute("COMMIT")
+                    future.set_result(rowcounts)
+                except Exception as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    logger.error(f"❌ Ошибка записи в БД: {e}")
+                    future.set_exception(e)
+        finally:
+            conn.close()
@@ -287,6 +287,15 @@ class LogoManager:
             
             username = username_match.group(1)
             logger.info(f"🐦 Извлечен username: @{username}")
+            
+            # Аватар зависит только от автора: для новых постов того же автора
+            # не повторяем цепочку запросов к Syndication API / Unavatar / DiceBear
+            username_key = self._get_cache_key(username.lstrip('@').lower(), 'twitter')
+            cached_path = self.cache.get(username_key)
+            if cached_path and Path(cached_path).exists():
+                logger.info(f"🐦 Аватар @{username} найден в кэше: {cached_path}")
+                return cached_path
+            
             avatar_url = self._get_twitter_avatar(username)
             
             if avatar_url:
@@ -294,6 +303,7 @@ class LogoManager:
                 output_path = self.logos_dir / f"twitter_{username}.png"
                 if self._download_image(avatar_url, output_path):
                     logger.info(f"📱 Скачан аватар @{username}: {output_path.name}")
+                    self.cache[username_key] = str(output_path)
                     return str(output_path)
                 else:
                     logger.warning(f"❌ Не удалось скачать аватарку: {avatar_url}")
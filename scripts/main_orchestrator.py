@@ -83,6 +83,8 @@ class ShortsNewsOrchestrator:
         logger.info("Инициализация движков новостных источников...")
         
         try:
+            # Все экземпляры движков создаются с конфигурацией оркестратора
+            registry.configure(self.config)
             # Регистрируем движки
             registry.register_engine('politico', PoliticoEngine)
             registry.register_engine('washingtonpost', WashingtonPostEngine)
@@ -34,6 +34,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Telegram передает неподтвержденные updates повторно не дольше суток: старые
+# отметки processed_messages для дедупликации уже не нужны
+PROCESSED_MESSAGES_RETENTION_SQL = "DELETE FROM processed_messages WHERE processed_at < datetime('now', '-7 days')"
+
 class NewsTelegramBot:
     """Telegram бот для приема новостей"""
 
@@ -79,11 +83,25 @@ class NewsTelegramBot:
         with open(config_path, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f)
 
+    def _connect(self) -> sqlite3.Connection:
+        """Открывает соединение с БД новостей с настроенными PRAGMA"""
+        conn = sqlite3.connect(self.db_path)
+        # synchronous=NORMAL в режиме WAL безопасен при сбоях и убирает fsync на каждый commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+
     def _init_user_news_db(self):
         """Инициализация расширенной базы данных для новостей"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL сохраняется в файле БД, поэтому достаточно включить его один раз.
+            # Рядом с user_news.db появятся служебные файлы user_news.db-wal и user_news.db-shm
+            conn.execute('PRAGMA journal_mode=WAL')
+
             # Основная таблица новостей
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS user_news (
@@ -137,13 +155,24 @@ class NewsTelegramBot:
                 )
             ''')
 
+            # Таблица уже обработанных сообщений монитора (дедупликация между перезапусками)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS processed_messages (
+                    message_key TEXT PRIMARY KEY,
+                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            removed = conn.execute(PROCESSED_MESSAGES_RETENTION_SQL).rowcount
+            if removed:
+                logger.info(f"🧹 Удалено устаревших отметок обработанных сообщений: {removed}")
+
             conn.commit()
         
         logger.info(f"Расширенная база данных новостей инициализирована: {self.db_path}")
 
         # Миграция: добавить недостающие столбцы
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("PRAGMA table_info(user_news)")
                 columns = {row[1] for row in cursor.fetchall()}
@@ -222,7 +251,7 @@ class NewsTelegramBot:
 
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Обработчик команды /stats"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute('''
                 SELECT COUNT(*) as total,
                        COUNT(CASE WHEN processed = 1 THEN 1 END) as processed,
@@ -262,7 +291,7 @@ class NewsTelegramBot:
 
             news_id = int(args[0])
             seconds = float(args[1])
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute('UPDATE user_news SET video_start_seconds=? WHERE id=?', (seconds, news_id))
                 conn.commit()
             await update.message.reply_text(f"✅ Старт для видео новости {news_id} установлен: {seconds} c")
@@ -272,7 +301,7 @@ class NewsTelegramBot:
     def _set_video_start_seconds(self, news_id: int, start_seconds: float):
         """Устанавливает время старта видео для новости."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -440,7 +469,7 @@ class NewsTelegramBot:
                 if len(parts) >= 3:
                     news_id = int(parts[1])
                     seconds = float(parts[2])
-                    with sqlite3.connect(self.db_path) as conn:
+                    with self._connect() as conn:
                         conn.execute('UPDATE user_news SET video_start_seconds=? WHERE id=?', (seconds, news_id))
                         conn.commit()
                     await update.message.reply_text(f"✅ Старт для видео новости {news_id} установлен: {seconds} c")
@@ -564,94 +593,132 @@ class NewsTelegramBot:
 
     def _is_url_already_processed(self, url: str) -> bool:
         """Проверка, была ли ссылка уже обработана"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 'SELECT id FROM user_news WHERE url = ?',
                 (url,)
             )
             return cursor.fetchone() is not None
 
+    def _is_message_processed(self, message_key: str) -> bool:
+        """Проверка, было ли сообщение канала уже обработано"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'SELECT 1 FROM processed_messages WHERE message_key = ?',
+                (message_key,)
+            )
+            return cursor.fetchone() is not None
+
+    def _mark_message_processed(self, message_key: str):
+        """Отметить сообщение канала как обработанное"""
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO processed_messages (message_key) VALUES (?)',
+                (message_key,)
+            )
+            conn.commit()
+
     def _save_parsed_news(self, news_data: Dict, user_id: int, chat_id: int) -> int:
         """Сохранение полной информации о новости в расширенную БД"""
-        with sqlite3.connect(self.db_path) as conn:
-            try:
-                # ЗАГЛУШКА ДЛЯ ТЕСТИРОВАНИЯ: Удаляем существующую новость с таким же URL.
-                # Это позволяет повторно обрабатывать одну и ту же новость во время тестов.
-                url_to_check = news_data.get('url')
-                if url_to_check:
-                    conn.execute('DELETE FROM user_news WHERE url = ?', (url_to_check,))
-                    logger.info(f"Удалена старая запись для URL (тестовый режим): {url_to_check}")
-
-                # Сохранение основной информации о новости
-                cursor = conn.execute('''
-                    INSERT INTO user_news (
-                        url, title, description, content, published_date, source,
-                        content_type, user_id, chat_id, fact_check_score,
-                        verification_status, images, videos, username, avatar_url, local_video_path, avatar_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    news_data.get('url'),
-                    news_data.get('title', 'Без заголовка'),
-                    news_data.get('description', ''),
-                    news_data.get('content', ''),  # Добавляем полный контент статьи
-                    news_data.get('published'),
-                    news_data.get('source', 'Неизвестен'),
-                    news_data.get('content_type', 'webpage'),
-                    user_id,
-                    chat_id,
-                    news_data.get('fact_verification', {}).get('accuracy_score'),
-                    news_data.get('fact_verification', {}).get('verification_status'),
-                    '|'.join(news_data.get('images', [])),
-                    '|'.join(news_data.get('videos', [])),
-                    news_data.get('username', ''),  # Добавляем username для аватарки
-                    news_data.get('avatar_url', ''),  # Добавляем URL аватарки
-                    news_data.get('local_video_path', ''),  # Добавляем путь к локальному видео
-                    news_data.get('avatar_path', '')  # Добавляем путь к аватарке
-                ))
-
-                news_id = cursor.lastrowid
-
-                # Сохранение изображений
-                images = news_data.get('images', [])
-                for image_url in images:
-                    conn.execute('''
-                        INSERT INTO news_images (news_id, image_url)
-                        VALUES (?, ?)
-                    ''', (news_id, image_url))
-
-                # Сохранение источников проверки фактов
-                verification_sources = news_data.get('verification_sources', [])
-                for source in verification_sources:
-                    conn.execute('''
-                        INSERT INTO fact_check_sources (
-                            news_id, source_url, source_title, confidence_score
-                        ) VALUES (?, ?, ?, ?)
-                    ''', (
-                        news_id,
-                        source.get('uri', ''),
-                        source.get('title', ''),
-                        0.8  # Пока фиксированная уверенность
-                    ))
+        return self._save_parsed_news_batch([news_data], user_id, chat_id)[0]
 
-                conn.commit()
-                logger.info(f"Новость сохранена в БД с ID {news_id}")
-
-                # Сервисное уведомление в группу, если есть видео
-                try:
-                    videos_list = news_data.get('videos') or []
-                    if isinstance(videos_list, str):
-                        videos_list = [v for v in videos_list.split(',') if v]
-                    if videos_list:
-                        self._notify_group_on_video(news_id, news_data.get('title',''), videos_list)
-                except Exception as e:
-                    logger.warning(f"Не удалось уведомить группу о видео: {e}")
-                return news_id
+    def _save_parsed_news_batch(self, news_items: list, user_id: int, chat_id: int) -> list:
+        """Сохранение пачки новостей в одной транзакции (один commit на всю пачку)"""
+        if not news_items:
+            return []
 
+        with self._connect() as conn:
+            try:
+                # Сразу берем блокировку на запись, чтобы не упираться в SQLITE_BUSY посреди пачки
+                conn.execute('BEGIN IMMEDIATE')
+                news_ids = [
+                    self._save_parsed_news_row(conn, news_data, user_id, chat_id)
+                    for news_data in news_items
+                ]
+                conn.commit()
             except Exception as e:
                 conn.rollback()
                 logger.error(f"Ошибка сохранения новости: {e}")
                 raise
 
+        for news_id, news_data in zip(news_ids, news_items):
+            logger.info(f"Новость сохранена в БД с ID {news_id}")
+
+            # Сервисное уведомление в группу, если есть видео
+            try:
+                videos_list = news_data.get('videos') or []
+                if isinstance(videos_list, str):
+                    videos_list = [v for v in videos_list.split(',') if v]
+                if videos_list:
+                    self._notify_group_on_video(news_id, news_data.get('title',''), videos_list)
+            except Exception as e:
+                logger.warning(f"Не удалось уведомить группу о видео: {e}")
+
+        return news_ids
+
+    def _save_parsed_news_row(self, conn: sqlite3.Connection, news_data: Dict, user_id: int, chat_id: int) -> int:
+        """Вставка одной новости в рамках уже открытой транзакции (без commit)"""
+        # ЗАГЛУШКА ДЛЯ ТЕСТИРОВАНИЯ: Удаляем существующую новость с таким же URL.
+        # Это позволяет повторно обрабатывать одну и ту же новость во время тестов.
+        url_to_check = news_data.get('url')
+        if url_to_check:
+            conn.execute('DELETE FROM user_news WHERE url = ?', (url_to_check,))
+            logger.info(f"Удалена старая запись для URL (тестовый режим): {url_to_check}")
+
+        # Сохранение основной информации о новости
+        cursor = conn.execute('''
+            INSERT INTO user_news (
+                url, title, description, content, published_date, source,
+                content_type, user_id, chat_id, fact_check_score,
+                verification_status, images, videos, username, avatar_url, local_video_path, avatar_path
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            news_data.get('url'),
+            news_data.get('title', 'Без заголовка'),
+            news_data.get('description', ''),
+            news_data.get('content', ''),  # Добавляем полный контент статьи
+            news_data.get('published'),
+            news_data.get('source', 'Неизвестен'),
+            news_data.get('content_type', 'webpage'),
+            user_id,
+            chat_id,
+            news_data.get('fact_verification', {}).get('accuracy_score'),
+            news_data.get('fact_verification', {}).get('verification_status'),
+            '|'.join(news_data.get('images', [])),
+            '|'.join(news_data.get('videos', [])),
+            news_data.get('username', ''),  # Добавляем username для аватарки
+            news_data.get('avatar_url', ''),  # Добавляем URL аватарки
+            news_data.get('local_video_path', ''),  # Добавляем путь к локальному видео
+            news_data.get('avatar_path', '')  # Добавляем путь к аватарке
+        ))
+
+        news_id = cursor.lastrowid
+
+        # Сохранение изображений
+        images = news_data.get('images', [])
+        conn.executemany('''
+            INSERT INTO news_images (news_id, image_url)
+            VALUES (?, ?)
+        ''', [(news_id, image_url) for image_url in images])
+
+        # Сохранение источников проверки фактов
+        verification_sources = news_data.get('verification_sources', [])
+        conn.executemany('''
+            INSERT INTO fact_check_sources (
+                news_id, source_url, source_title, confidence_score
+            ) VALUES (?, ?, ?, ?)
+        ''', [
+            (
+                news_id,
+                source.get('uri', ''),
+                source.get('title', ''),
+                0.8  # Пока фиксированная уверенность
+            )
+            for source in verification_sources
+        ])
+
+        return news_id
+
     def _save_user_news(self, url: str, user_id: int, chat_id: int) -> int:
         """Устаревший метод для совместимости - сохраняет базовую новость"""
         news_data = {
@@ -665,7 +732,7 @@ class NewsTelegramBot:
 
     def mark_news_processed(self, news_id: int, title: str = None, description: str = None):
         """Отметить новость как обработанную"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute('''
                 UPDATE user_news
                 SET processed = 1, processed_at = ?
@@ -697,7 +764,7 @@ class NewsTelegramBot:
 
     def get_pending_news(self, limit: int = 10) -> list:
         """Получение необработанных новостей с полной информацией"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             # Получение основных данных новостей
@@ -781,7 +848,7 @@ class NewsTelegramBot:
 
     def get_news_by_id(self, news_id: int) -> Dict:
         """Получение конкретной новости по ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             
             cursor = conn.execute('''
@@ -858,7 +925,7 @@ class NewsTelegramBot:
 
     def mark_video_created(self, news_id: int, video_url: str = None):
         """Отметить, что видео создано для новости"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute('''
                 UPDATE user_news
                 SET video_created = 1, video_url = ?